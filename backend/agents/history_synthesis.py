@@ -15,6 +15,9 @@ import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
 
+# Documents fetched per cursor round trip when reading a patient's history
+HISTORY_QUERY_BATCH_SIZE = 500
+
 class HistorySynthesisAgent:
     """
     Specialized AI Agent for Patient History Synthesis
@@ -32,6 +35,7 @@ class HistorySynthesisAgent:
         
         # Cache TTL for patient data
         self.cache_ttl = 3600  # 1 hour
+        self.query_batch_size = getattr(settings, "HISTORY_QUERY_BATCH_SIZE", HISTORY_QUERY_BATCH_SIZE)
         
     async def synthesize_history(self, patient_id: str) -> Dict[str, Any]:
         """
@@ -120,30 +124,30 @@ class HistorySynthesisAgent:
             if patient:
                 patient_data["demographics"] = patient
             
-            # Get medical records
+            # Get medical records, labs, medications, vitals and diagnoses;
+            # large cursor batches keep getMore round trips down
+            query = {"patient_id": patient_id}
+            batch_size = self.query_batch_size
+            
             records_collection = self.db["medical_records"]
-            async for record in records_collection.find({"patient_id": patient_id}):
-                patient_data["medical_records"].append(record)
+            patient_data["medical_records"] = await records_collection.find(
+                query, batch_size=batch_size).to_list(length=None)
             
-            # Get lab results
             labs_collection = self.db["lab_results"]
-            async for lab in labs_collection.find({"patient_id": patient_id}).sort("date", -1):
-                patient_data["lab_results"].append(lab)
+            patient_data["lab_results"] = await labs_collection.find(
+                query, batch_size=batch_size).sort("date", -1).to_list(length=None)
             
-            # Get medications
             medications_collection = self.db["medications"]
-            async for medication in medications_collection.find({"patient_id": patient_id}):
-                patient_data["medications"].append(medication)
+            patient_data["medications"] = await medications_collection.find(
+                query, batch_size=batch_size).to_list(length=None)
             
-            # Get vital signs
             vitals_collection = self.db["vital_signs"]
-            async for vital in vitals_collection.find({"patient_id": patient_id}).sort("timestamp", -1):
-                patient_data["vital_signs"].append(vital)
+            patient_data["vital_signs"] = await vitals_collection.find(
+                query, batch_size=batch_size).sort("timestamp", -1).to_list(length=None)
             
-            # Get diagnoses
             diagnoses_collection = self.db["diagnoses"]
-            async for diagnosis in diagnoses_collection.find({"patient_id": patient_id}):
-                patient_data["diagnoses"].append(diagnosis)
+            patient_data["diagnoses"] = await diagnoses_collection.find(
+                query, batch_size=batch_size).to_list(length=None)
             
             return patient_data
             
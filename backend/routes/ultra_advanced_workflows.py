@@ -69,6 +69,7 @@ class WorkflowStatusResponse(BaseModel):
 class SystemStatusResponse(BaseModel):
     """Response model for system status"""
     active_workflows: int
+    status_counts: Dict[str, int]
     queue_lengths: Dict[str, int]
     agent_status: Dict[str, Any]
     connected_clients: int
@@ -337,6 +338,7 @@ async def get_system_status(
         
         return SystemStatusResponse(
             active_workflows=status["active_workflows"],
+            status_counts=status["status_counts"],
             queue_lengths=status["queue_lengths"],
             agent_status=status["agent_status"],
             connected_clients=status["connected_clients"],
@@ -351,20 +353,24 @@ async def get_system_status(
 @router.get("/workflows/active")
 async def get_active_workflows(
     coordinator: UltraAdvancedWorkflowCoordinator = Depends(get_workflow_coordinator),
-    limit: int = 50
+    limit: int = 50,
+    patient_id: Optional[str] = None,
+    status: Optional[WorkflowStatus] = None
 ):
     """
     Get list of active workflows
     
     Returns information about currently running workflows including
-    status, progress, and estimated completion times.
+    status, progress, and estimated completion times. Optionally
+    filtered by patient and/or workflow status.
     """
     try:
         active_workflows = []
+        matching = coordinator.find_active(patient_id=patient_id, status=status)
         
-        for workflow_id, workflow_result in coordinator.active_workflows.items():
+        for workflow_result in matching:
             active_workflows.append({
-                "workflow_id": workflow_id,
+                "workflow_id": workflow_result.workflow_id,
                 "workflow_type": workflow_result.workflow_type.value,
                 "patient_id": workflow_result.patient_id,
                 "status": workflow_result.status.value,
@@ -380,7 +386,7 @@ async def get_active_workflows(
         
         return {
             "active_workflows": active_workflows,
-            "total_count": len(coordinator.active_workflows),
+            "total_count": len(matching),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -5,10 +5,33 @@ Generates realistic medical data for testing and demonstrations
 
 import json
 import random
+from functools import lru_cache
+from itertools import cycle, islice
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import uuid
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@lru_cache(maxsize=1024)
+def _clinical_notes_for(condition: str, age: int, gender: str) -> Dict[str, str]:
+    """Clinical note text, which is fully determined by condition, age and gender"""
+    
+    return {
+        "chief_complaint": f"{age}-year-old {gender.lower()} with {condition}",
+        "history_present_illness": f"Patient presents with worsening symptoms related to known {condition}. Reports increased difficulty with daily activities.",
+        "assessment": f"Stable {condition} with good medication compliance. Continue current management plan.",
+        "plan": "Continue current medications, follow up in 3 months, order routine lab work."
+    }
+
 class MedicalDemoDataGenerator:
     """
     Generates comprehensive demo data for medical AI system testing
@@ -19,6 +42,23 @@ class MedicalDemoDataGenerator:
         self.conditions_database = self._initialize_conditions_database()
         self.medications_database = self._initialize_medications_database()
         
+        # Symptom pools as object arrays for vectorized batch sampling
+        self._rng = np.random.default_rng()
+        self._symptom_pools = {
+            condition: np.array(data["symptoms"], dtype=object)
+            for condition, data in self.conditions_database.items()
+        }
+        
+        # Read-only per-condition parts of expected_findings, shared by patients
+        self._expected_findings_base = {
+            condition: MappingProxyType({
+                "primary_diagnosis": condition,
+                "imaging_findings": tuple(data.get("imaging_findings", [])),
+                "risk_factors": tuple(data.get("risk_factors", []))
+            })
+            for condition, data in self.conditions_database.items()
+        }
+        
     def _initialize_patient_templates(self) -> List[Dict]:
         """Initialize patient profile templates"""
         return [
@@ -122,40 +162,59 @@ class MedicalDemoDataGenerator:
             }
         }
     
-    def generate_comprehensive_patient(self, patient_template: Dict = None) -> Dict[str, Any]:
-        """Generate comprehensive patient data"""
+    def generate_comprehensive_patient(self, patient_template: Dict = None,
+                                       now: Optional[datetime] = None,
+                                       dob_cache: Optional[Dict[int, str]] = None,
+                                       symptoms: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Generate comprehensive patient data
+        
+        Batch callers pass a shared ``now`` and ``dob_cache`` so the clock is
+        read once and each template age is formatted once per batch, and may
+        pass pre-drawn ``symptoms`` from ``_sample_symptoms_batch``.
+        """
         
         if not patient_template:
             patient_template = random.choice(self.patient_templates)
+        if now is None:
+            now = datetime.now()
+        if dob_cache is None:
+            dob_cache = {}
         
         patient_id = f"DEMO_{uuid.uuid4().hex[:8].upper()}"
         condition = patient_template["primary_condition"]
         condition_data = self.conditions_database.get(condition, {})
+        if symptoms is None:
+            symptoms = random.sample(condition_data.get("symptoms", []),
+                                     min(4, len(condition_data.get("symptoms", []))))
+        
+        age = patient_template["age"]
+        dob = dob_cache.get(age)
+        if dob is None:
+            dob = dob_cache[age] = (now - timedelta(days=age * 365)).strftime("%Y-%m-%d")
         
         # Generate patient demographics
         patient_data = {
             "patient_id": patient_id,
             "demographics": {
                 "name": patient_template["name"],
-                "age": patient_template["age"],
+                "age": age,
                 "gender": patient_template["gender"],
                 "mrn": f"MRN{random.randint(100000, 999999)}",
-                "dob": (datetime.now() - timedelta(days=patient_template["age"] * 365)).strftime("%Y-%m-%d")
+                "dob": dob
             },
             
             # Analysis request data
             "analysis_type": "comprehensive",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             
             # Medical images (simulated)
             "medical_images": self._generate_medical_images(condition),
             
             # Current medications
-            "medications": self._generate_medications(condition_data.get("medications", [])),
+            "medications": self._generate_medications(condition_data.get("medications", []), now),
             
             # Current symptoms
-            "symptoms": random.sample(condition_data.get("symptoms", []), 
-                                    min(4, len(condition_data.get("symptoms", [])))),
+            "symptoms": symptoms,
             
             # Lab results
             "lab_results": self._generate_lab_results(condition_data.get("lab_abnormalities", {})),
@@ -171,9 +230,11 @@ class MedicalDemoDataGenerator:
             
             # Expected findings (for validation)
             "expected_findings": {
-                "primary_diagnosis": condition,
-                "imaging_findings": condition_data.get("imaging_findings", []),
-                "risk_factors": condition_data.get("risk_factors", []),
+                **self._expected_findings_base.get(condition, {
+                    "primary_diagnosis": condition,
+                    "imaging_findings": (),
+                    "risk_factors": ()
+                }),
                 "complexity_level": patient_template["complexity"]
             }
         }
@@ -210,9 +271,12 @@ class MedicalDemoDataGenerator:
         
         return image_mappings.get(condition, ["/demo/images/chest_xray_normal.jpg"])
     
-    def _generate_medications(self, condition_meds: List[str]) -> List[Dict]:
+    def _generate_medications(self, condition_meds: List[str],
+                              now: Optional[datetime] = None) -> List[Dict]:
         """Generate medication list with dosages"""
         
+        if now is None:
+            now = datetime.now()
         medications = []
         for med_name in condition_meds[:4]:  # Limit to 4 medications
             med_data = self.medications_database.get(med_name, {})
@@ -232,7 +296,7 @@ class MedicalDemoDataGenerator:
                 "dosage": dosages.get(med_name, "Standard dose"),
                 "frequency": "As prescribed",
                 "class": med_data.get("class", "Unknown"),
-                "start_date": (datetime.now() - timedelta(days=random.randint(30, 365))).strftime("%Y-%m-%d")
+                "start_date": (now - timedelta(days=random.randint(30, 365))).strftime("%Y-%m-%d")
             })
         
         return medications
@@ -349,28 +413,48 @@ class MedicalDemoDataGenerator:
     def _generate_clinical_notes(self, condition: str, template: Dict) -> Dict[str, str]:
         """Generate clinical notes"""
         
-        return {
-            "chief_complaint": f"{template['age']}-year-old {template['gender'].lower()} with {condition}",
-            "history_present_illness": f"Patient presents with worsening symptoms related to known {condition}. Reports increased difficulty with daily activities.",
-            "assessment": f"Stable {condition} with good medication compliance. Continue current management plan.",
-            "plan": "Continue current medications, follow up in 3 months, order routine lab work."
-        }
+        # Copy so callers can annotate notes without touching the cached entry
+        return dict(_clinical_notes_for(condition, template['age'], template['gender']))
     
     def generate_multiple_patients(self, count: int = 5) -> List[Dict[str, Any]]:
         """Generate multiple demo patients"""
         
-        patients = []
-        templates = self.patient_templates * (count // len(self.patient_templates) + 1)
+        now = datetime.now()
+        dob_cache: Dict[int, str] = {}
+        templates = list(islice(cycle(self.patient_templates), count))
+        symptom_samples = self._sample_symptoms_batch(
+            [template["primary_condition"] for template in templates]
+        )
+        
+        return [self.generate_comprehensive_patient(template, now, dob_cache, symptoms)
+                for template, symptoms in zip(templates, symptom_samples)]
+    
+    def _sample_symptoms_batch(self, conditions: List[str]) -> List[List[str]]:
+        """Draw up to 4 distinct symptoms per patient, one RNG draw per condition"""
         
-        for i in range(count):
-            template = templates[i]
-            patient = self.generate_comprehensive_patient(template)
-            patients.append(patient)
+        samples: List[List[str]] = [[] for _ in conditions]
+        rows_by_condition: Dict[str, List[int]] = {}
+        for row, condition in enumerate(conditions):
+            rows_by_condition.setdefault(condition, []).append(row)
         
-        return patients
+        for condition, rows in rows_by_condition.items():
+            pool = self._symptom_pools.get(condition)
+            if pool is None or len(pool) == 0:
+                continue
+            k = min(4, len(pool))
+            # argsort of uniform keys gives an independent permutation per row
+            picks = np.argsort(self._rng.random((len(rows), len(pool))), axis=1)[:, :k]
+            for row, symptoms in zip(rows, pool[picks].tolist()):
+                samples[row] = symptoms
+        
+        return samples
     
-    def save_demo_data(self, output_path: str = "demo_medical_data.json"):
-        """Save generated demo data to file"""
+    def save_demo_data(self, output_path: str = "demo_medical_data.json", pretty: bool = False):
+        """Save generated demo data to file
+        
+        Compact output is written as bytes with orjson when it is installed;
+        ``pretty=True`` keeps the indented stdlib output for debugging.
+        """
         
         demo_data = {
             "generated_at": datetime.now().isoformat(),
@@ -382,8 +466,12 @@ class MedicalDemoDataGenerator:
             }
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(demo_data, f, indent=2)
+        if ORJSON_AVAILABLE and not pretty:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(demo_data))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(demo_data, f, indent=2 if pretty else None)
         
         return demo_data
 
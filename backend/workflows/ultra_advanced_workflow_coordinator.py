@@ -5,20 +5,54 @@ Supports AI Diagnosis, Clinical Decision Support, Image Analysis, and Research w
 """
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Union
-from enum import Enum
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Union
+from enum import Enum, IntFlag
+from types import MappingProxyType
 import uuid
 import json
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
 import redis.asyncio as redis
 from fastapi import WebSocket, WebSocketDisconnect
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _encode_json(payload: Dict[str, Any]) -> str:
+    """Serialize a broadcast payload, using orjson when it is installed
+    
+    Datetimes are written as ISO 8601 strings either way (orjson does this natively).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, default=lambda value: value.isoformat())
+
 class WorkflowType(Enum):
     """Enhanced workflow types for comprehensive medical AI"""
     AI_DIAGNOSIS = "ai_diagnosis"
@@ -45,7 +79,72 @@ class WorkflowStatus(Enum):
     ERROR = "error"
     CANCELLED = "cancelled"
 
-@dataclass
+# Enum member -> string value, read without the Enum.value descriptor on hot paths
+_STATUS_STR = {status: status.value for status in WorkflowStatus}
+_TYPE_STR = {workflow_type: workflow_type.value for workflow_type in WorkflowType}
+
+# Progress percentage and step description shown for each status
+_STATUS_PROGRESS = {
+    WorkflowStatus.PENDING: 0,
+    WorkflowStatus.INITIALIZING: 10,
+    WorkflowStatus.AGENT_COORDINATION: 20,
+    WorkflowStatus.IMAGE_PROCESSING: 35,
+    WorkflowStatus.HISTORY_ANALYSIS: 50,
+    WorkflowStatus.DRUG_CHECKING: 65,
+    WorkflowStatus.RESEARCH_SYNTHESIS: 75,
+    WorkflowStatus.CLINICAL_ANALYSIS: 85,
+    WorkflowStatus.REPORT_GENERATION: 95,
+    WorkflowStatus.COMPLETED: 100,
+    WorkflowStatus.ERROR: 0,
+    WorkflowStatus.CANCELLED: 0
+}
+
+_STATUS_STEPS = {
+    WorkflowStatus.PENDING: "Workflow queued",
+    WorkflowStatus.INITIALIZING: "Initializing AI agents",
+    WorkflowStatus.AGENT_COORDINATION: "Coordinating multi-agent analysis",
+    WorkflowStatus.IMAGE_PROCESSING: "Processing medical images with MONAI AI",
+    WorkflowStatus.HISTORY_ANALYSIS: "Analyzing patient medical history",
+    WorkflowStatus.DRUG_CHECKING: "Checking drug interactions and safety",
+    WorkflowStatus.RESEARCH_SYNTHESIS: "Synthesizing research evidence",
+    WorkflowStatus.CLINICAL_ANALYSIS: "Generating clinical recommendations",
+    WorkflowStatus.REPORT_GENERATION: "Generating comprehensive report",
+    WorkflowStatus.COMPLETED: "Analysis complete",
+    WorkflowStatus.ERROR: "Error occurred",
+    WorkflowStatus.CANCELLED: "Workflow cancelled"
+}
+
+class AgentMask(IntFlag):
+    """Bit per agent, recording which agents contributed to a workflow"""
+    IMAGE_ANALYSIS = 1
+    HISTORY_SYNTHESIS = 2
+    DRUG_INTERACTION = 4
+    RESEARCH = 8
+    CLINICAL_DECISION = 16
+    PRECISION_MEDICINE = 32
+
+class WorkflowFlags(IntFlag):
+    """Quality facts recorded as agent results arrive, read by the adherence score"""
+    HAS_TREATMENT = 1  # treatment recommendations were generated
+    DRUG_CHECKED = 2  # drug interaction analysis completed without error
+    GUIDELINES_CHECKED = 4  # research synthesis reviewed clinical guidelines
+
+# Agent name <-> mask bit, in canonical agent order
+AGENT_MASKS = MappingProxyType({
+    "image_analysis": AgentMask.IMAGE_ANALYSIS,
+    "history_synthesis": AgentMask.HISTORY_SYNTHESIS,
+    "drug_interaction": AgentMask.DRUG_INTERACTION,
+    "research": AgentMask.RESEARCH,
+    "clinical_decision": AgentMask.CLINICAL_DECISION,
+    "precision_medicine": AgentMask.PRECISION_MEDICINE
+})
+
+@lru_cache(maxsize=64)
+def _agent_names(mask: int) -> tuple:
+    """Agent names set in a mask; at most 64 distinct masks exist"""
+    return tuple(name for name, bit in AGENT_MASKS.items() if mask & bit)
+
+@dataclass(slots=True)
 class WorkflowRequest:
     """Enhanced workflow request with comprehensive patient data"""
     workflow_type: WorkflowType
@@ -65,7 +164,7 @@ class WorkflowRequest:
     research_protocols_enabled: bool = True
     explainable_ai_enabled: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowResult:
     """Comprehensive workflow execution result"""
     workflow_id: str
@@ -100,12 +199,253 @@ class WorkflowResult:
     safety_alerts: List[Dict[str, Any]] = None
     
     # Performance Metrics
-    agents_used: List[str] = None
+    agent_mask: AgentMask = AgentMask(0)
+    quality_flags: WorkflowFlags = WorkflowFlags(0)
     processing_steps: List[Dict[str, Any]] = None
     resource_utilization: Dict[str, Any] = None
     
     error_message: Optional[str] = None
     warnings: List[str] = None
+    
+    def to_document(self) -> Dict[str, Any]:
+        """Shallow, storage-ready dict: enums as values and datetimes as ISO strings
+        
+        Nested agent results are already plain dicts, so unlike ``asdict`` this
+        does not deep-copy them.
+        """
+        document = {name: getattr(self, name) for name in _WORKFLOW_RESULT_FIELDS}
+        document["workflow_type"] = _TYPE_STR[self.workflow_type]
+        document["agent_mask"] = int(self.agent_mask)
+        document["quality_flags"] = int(self.quality_flags)
+        document["agents_used"] = self.agents_used
+        document["status"] = _STATUS_STR[self.status]
+        if self.start_time:
+            document["start_time"] = self.start_time.isoformat()
+        if self.end_time:
+            document["end_time"] = self.end_time.isoformat()
+        return document
+    
+    @property
+    def agents_used(self) -> List[str]:
+        """Names of the agents that contributed, decoded from ``agent_mask``"""
+        return list(_agent_names(self.agent_mask))
+
+_WORKFLOW_RESULT_FIELDS = tuple(field.name for field in fields(WorkflowResult))
+
+class FindingsAggregate(NamedTuple):
+    """Result of one pass over the consolidated findings"""
+    ranked: List[Dict[str, Any]]  # up to six findings, most confident first
+    supporting_sources: List[str]  # sources of findings with confidence > 0.7
+
+def _aggregate_findings(findings: List[Dict[str, Any]]) -> FindingsAggregate:
+    """Rank the top six findings and collect supporting sources in a single pass
+    
+    Ties keep input order, matching ``max`` and a stable descending sort.
+    """
+    top: List[tuple] = []  # min-heap of (confidence, -index)
+    supporting_sources = []
+    for index, finding in enumerate(findings):
+        confidence = finding.get("confidence", 0.0)
+        if confidence > 0.7:
+            supporting_sources.append(finding["source"])
+        if len(top) < 6:
+            heapq.heappush(top, (confidence, -index))
+        else:
+            heapq.heappushpop(top, (confidence, -index))
+    
+    ranked = [findings[-neg_index] for _, neg_index in sorted(top, reverse=True)]
+    return FindingsAggregate(ranked, supporting_sources)
+
+# Simplified diagnosis -> ICD-10 mapping; a real implementation would use a proper medical coding system
+ICD10_MAPPING = MappingProxyType({
+    "pneumonia": "J18.9",
+    "pleural effusion": "J94.8",
+    "consolidation": "J18.9",
+    "atelectasis": "J98.11"
+})
+DEFAULT_ICD10_CODE = "Z00.00"  # General examination code
+
+def _build_icd10_automaton():
+    """Aho-Corasick automaton over the mapped conditions, valued (mapping order, code)"""
+    automaton = ahocorasick.Automaton()
+    for priority, (condition, code) in enumerate(ICD10_MAPPING.items()):
+        automaton.add_word(condition, (priority, code))
+    automaton.make_automaton()
+    return automaton
+
+_ICD10_AUTOMATON = _build_icd10_automaton() if AHOCORASICK_AVAILABLE else None
+
+@lru_cache(maxsize=4096)
+def _lookup_icd10_code(diagnosis: str) -> str:
+    """Resolve a diagnosis to its ICD-10 code, memoized since diagnoses repeat across patients
+    
+    The first mapped condition (in mapping order) found in the text wins.
+    """
+    diagnosis_lower = diagnosis.lower()
+    if _ICD10_AUTOMATON is not None:
+        # One scan of the text finds every mapped condition it contains
+        matches = [value for _, value in _ICD10_AUTOMATON.iter(diagnosis_lower)]
+        return min(matches)[1] if matches else DEFAULT_ICD10_CODE
+    for condition, code in ICD10_MAPPING.items():
+        if condition in diagnosis_lower:
+            return code
+    return DEFAULT_ICD10_CODE
+
+# Lower edges of the fair, good and excellent image quality buckets
+QUALITY_BUCKET_EDGES = np.array([0.5, 0.7, 0.9])
+
+# Confidence arrays at least this large use the compiled reduction; below it
+# NumPy's per-call overhead is smaller than the dispatch cost
+NUMBA_MIN_FINDINGS = 256
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _reduce_confidences(values):
+        """Mean, min, max and population std of a non-empty array"""
+        n = values.size
+        total = 0.0
+        lowest = values[0]
+        highest = values[0]
+        for value in values:
+            total += value
+            lowest = min(lowest, value)
+            highest = max(highest, value)
+        mean = total / n
+        squared = 0.0
+        for value in values:
+            squared += (value - mean) * (value - mean)
+        return mean, lowest, highest, math.sqrt(squared / n)
+    
+    # Compile at import rather than on the first large study
+    _reduce_confidences(np.zeros(1))
+
+# Safety alert added when overall AI confidence is below 0.7; shared, never mutated
+LOW_CONFIDENCE_ALERTS = ({
+    "level": "warning",
+    "message": "Low AI confidence detected - consider additional diagnostic workup",
+    "recommendation": "Seek specialist consultation"
+},)
+
+# Guideline adherence weight of each quality flag
+ADHERENCE_FLAGS = np.array([WorkflowFlags.HAS_TREATMENT, WorkflowFlags.DRUG_CHECKED,
+                            WorkflowFlags.GUIDELINES_CHECKED], dtype=np.int64)
+ADHERENCE_WEIGHTS = np.array([0.4, 0.3, 0.3])
+
+def score_workflows_batch(workflows: List[WorkflowResult]) -> np.ndarray:
+    """Guideline adherence scores for many workflows at once, e.g. for audit reports
+    
+    Same scores as ``_assess_guidelines_adherence``, computed as one flag matrix product.
+    """
+    flags = np.fromiter((int(workflow.quality_flags) for workflow in workflows),
+                        dtype=np.int64, count=len(workflows))
+    present = (flags[:, None] & ADHERENCE_FLAGS) != 0
+    return np.minimum(present @ ADHERENCE_WEIGHTS, 1.0)
+
+# Queue priorities in dispatch order, and the default size of the worker pool
+WORKFLOW_PRIORITIES = ("critical", "emergent", "urgent", "routine")
+DEFAULT_WORKFLOW_WORKERS = 16
+
+# Workflow status mirrored to Redis: key TTL and pub/sub channel
+WORKFLOW_STATUS_TTL_SECONDS = 300
+WORKFLOW_UPDATES_CHANNEL = "workflow_updates"
+# Window over which changed workflows are coalesced into one broadcast
+BROADCAST_DEBOUNCE_SECONDS = 0.01
+# Broadcasts buffered per client before the oldest is dropped
+WS_CLIENT_QUEUE_SIZE = 128
+# A client whose send stalls longer than this is disconnected
+WS_SEND_TIMEOUT_SECONDS = 1.0
+
+# Completed workflows are bulk-inserted once this many queue up, or after this delay
+RESULTS_BATCH_SIZE = 100
+RESULTS_FLUSH_INTERVAL_SECONDS = 0.05
+# Small per-workflow fields stored in `workflows`; the bulky agent results and
+# analysis go to `workflow_blobs`, keyed by the same workflow_id
+WORKFLOW_SUMMARY_FIELDS = (
+    "workflow_id", "workflow_type", "status", "patient_id", "user_id",
+    "start_time", "end_time", "processing_time_ms", "ai_confidence", "evidence_level",
+    "clinical_guidelines_adherence", "agents_used", "agent_mask", "quality_flags", "error_message"
+)
+_SUMMARY_ONLY_FIELDS = frozenset(WORKFLOW_SUMMARY_FIELDS) - {"workflow_id"}
+
+# Images analyzed at once per workflow unless settings.IMAGE_ANALYSIS_CONCURRENCY is set
+DEFAULT_IMAGE_ANALYSIS_CONCURRENCY = 4
+
+# Static agent plans per workflow type; tuples so the shared plans cannot be mutated.
+# "order" lists groups that run one after another, agents within a group run in parallel.
+STATIC_AGENT_PLANS = {
+    WorkflowType.AI_DIAGNOSIS: MappingProxyType({
+        "agents": ("image_analysis", "history_synthesis", "drug_interaction", "research", "clinical_decision"),
+        "order": (
+            ("image_analysis", "history_synthesis"),  # Parallel
+            ("drug_interaction",),
+            ("research",),
+            ("clinical_decision",)
+        ),
+        "parallel_groups": (),
+        "dependencies": MappingProxyType({})
+    }),
+    WorkflowType.IMAGE_ANALYSIS: MappingProxyType({
+        "agents": ("image_analysis", "research"),
+        "order": (("image_analysis",), ("research",)),
+        "parallel_groups": (),
+        "dependencies": MappingProxyType({})
+    }),
+    WorkflowType.CLINICAL_DECISION_SUPPORT: MappingProxyType({
+        "agents": ("history_synthesis", "drug_interaction", "clinical_decision", "research"),
+        "order": (
+            ("history_synthesis", "drug_interaction"),
+            ("research",),
+            ("clinical_decision",)
+        ),
+        "parallel_groups": (),
+        "dependencies": MappingProxyType({})
+    }),
+    WorkflowType.PRECISION_MEDICINE: MappingProxyType({
+        "agents": ("history_synthesis", "drug_interaction", "research", "precision_medicine"),
+        "order": (
+            ("history_synthesis", "drug_interaction"),
+            ("research",),
+            ("precision_medicine",)
+        ),
+        "parallel_groups": (),
+        "dependencies": MappingProxyType({})
+    })
+}
+EMPTY_AGENT_PLAN = MappingProxyType({
+    "agents": (),
+    "order": (),
+    "parallel_groups": (),
+    "dependencies": MappingProxyType({})
+})
+
+# Agent name -> (status shown while its group runs, WorkflowResult field for its output)
+AGENT_STEPS = {
+    "image_analysis": (WorkflowStatus.IMAGE_PROCESSING, "image_analysis_results"),
+    "history_synthesis": (WorkflowStatus.HISTORY_ANALYSIS, "history_synthesis_results"),
+    "drug_interaction": (WorkflowStatus.DRUG_CHECKING, "drug_interaction_results"),
+    "research": (WorkflowStatus.RESEARCH_SYNTHESIS, "research_results"),
+    "clinical_decision": (WorkflowStatus.CLINICAL_ANALYSIS, "clinical_decision_results"),
+    "precision_medicine": (None, "precision_medicine_results")
+}
+
+# Agents that read other agents' results; those agents must finish in an earlier group
+AGENT_INPUTS = MappingProxyType({
+    "clinical_decision": ("image_analysis", "history_synthesis", "drug_interaction", "research")
+})
+
+def _check_group_order(groups) -> None:
+    """Raise if an agent is scheduled in the same group as, or before, an agent it reads"""
+    finished = set()
+    scheduled = {agent for group in groups for agent in group}
+    for group in groups:
+        for agent in group:
+            pending = [name for name in AGENT_INPUTS.get(agent, ()) if name in scheduled and name not in finished]
+            if pending:
+                raise ValueError(f"Agent {agent} is scheduled before its inputs {pending} finish")
+        finished.update(group)
+
+for _plan in STATIC_AGENT_PLANS.values():
+    _check_group_order(_plan["order"])
 
 class UltraAdvancedWorkflowCoordinator:
     """
@@ -127,6 +467,9 @@ class UltraAdvancedWorkflowCoordinator:
         
         # Active workflows tracking
         self.active_workflows: Dict[str, WorkflowResult] = {}
+        # Secondary indexes over active_workflows, kept in step with every status change
+        self._by_patient: Dict[str, set] = defaultdict(set)
+        self._by_status: Dict[WorkflowStatus, set] = defaultdict(set)
         self.workflow_queues: Dict[str, asyncio.Queue] = {
             "routine": asyncio.Queue(maxsize=100),
             "urgent": asyncio.Queue(maxsize=50),
@@ -134,13 +477,33 @@ class UltraAdvancedWorkflowCoordinator:
             "critical": asyncio.Queue(maxsize=10)
         }
         
+        # Worker tasks that pull workflows off the priority queues
+        self._work_available = asyncio.Event()
+        self._worker_tasks: List[asyncio.Task] = []
+        
         # WebSocket connections for real-time updates
         self.websocket_connections: Dict[str, WebSocket] = {}
+        self._ws_lock = asyncio.Lock()  # serializes register/unregister
+        # Per-client outbound queue and the writer task draining it
+        self._client_queues: Dict[str, asyncio.Queue] = {}
+        self._client_writers: Dict[str, asyncio.Task] = {}
+        # Clients whose writer hit a send failure, pruned together on the next broadcast
+        self._dead_clients: List[tuple] = []
+        
+        # Workflows changed since the last broadcast; one task publishes their latest state
+        self._dirty_workflows: set = set()
+        self._broadcast_event = asyncio.Event()
+        self._broadcast_task: Optional[asyncio.Task] = None
         
         # Agent pool initialization
         self.agents = {}
         self.agent_status = {}
         
+        # Completed workflow documents awaiting one bulk insert
+        self._pending_results: List[Dict[str, Any]] = []
+        self._results_ready = asyncio.Event()
+        self._results_flush_task: Optional[asyncio.Task] = None
+        
         logger.info("🚀 Ultra-Advanced Medical AI Workflow Coordinator initialized")
     
     async def initialize_agents(self):
@@ -180,7 +543,7 @@ class UltraAdvancedWorkflowCoordinator:
             logger.info("✅ All medical AI agents initialized successfully")
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize agents: {e}")
+            logger.error("❌ Failed to initialize agents: %s", e)
             raise
     
     async def start_workflow(self, request: WorkflowRequest) -> str:
@@ -199,7 +562,6 @@ class UltraAdvancedWorkflowCoordinator:
                 patient_id=request.patient_id,
                 user_id=request.user_id,
                 start_time=datetime.now(timezone.utc),
-                agents_used=[],
                 processing_steps=[],
                 resource_utilization={},
                 safety_alerts=[],
@@ -208,104 +570,139 @@ class UltraAdvancedWorkflowCoordinator:
             
             # Store in active workflows
             self.active_workflows[workflow_id] = workflow_result
+            self._by_patient[request.patient_id].add(workflow_id)
+            self._by_status[WorkflowStatus.PENDING].add(workflow_id)
             
-            # Add to appropriate priority queue
+            # Add to appropriate priority queue; workers drain the most urgent first
+            self._ensure_workers()
             await self.workflow_queues[request.priority].put((workflow_id, request))
+            self._work_available.set()
             
-            # Start workflow processing in background
-            asyncio.create_task(self._process_workflow(workflow_id, request))
-            
-            logger.info(f"🚀 Workflow {workflow_id} started for patient {request.patient_id}")
+            logger.info("🚀 Workflow %s started for patient %s", workflow_id, request.patient_id)
             return workflow_id
             
         except Exception as e:
-            logger.error(f"❌ Failed to start workflow: {e}")
+            logger.error("❌ Failed to start workflow: %s", e)
             if workflow_id in self.active_workflows:
-                self.active_workflows[workflow_id].status = WorkflowStatus.ERROR
+                self._set_status(self.active_workflows[workflow_id], WorkflowStatus.ERROR)
                 self.active_workflows[workflow_id].error_message = str(e)
             raise
     
+    def _set_status(self, workflow: WorkflowResult, status: WorkflowStatus):
+        """Move a workflow to a new status, keeping the status index current"""
+        self._by_status[workflow.status].discard(workflow.workflow_id)
+        self._by_status[status].add(workflow.workflow_id)
+        workflow.status = status
+    
+    def find_active(self, patient_id: Optional[str] = None,
+                    status: Optional[WorkflowStatus] = None) -> List[WorkflowResult]:
+        """Tracked workflows, narrowed by patient and/or status through the indexes"""
+        if patient_id is None and status is None:
+            return list(self.active_workflows.values())
+        workflow_ids = None
+        if patient_id is not None:
+            workflow_ids = self._by_patient.get(patient_id, set())
+        if status is not None:
+            status_ids = self._by_status.get(status, set())
+            workflow_ids = status_ids if workflow_ids is None else workflow_ids & status_ids
+        return [self.active_workflows[workflow_id] for workflow_id in workflow_ids]
+    
+    def count_by_status(self, status: WorkflowStatus) -> int:
+        """Number of tracked workflows currently in a status"""
+        return len(self._by_status.get(status, ()))
+    
+    def _ensure_workers(self):
+        """Start the workflow worker pool on first use"""
+        if self._worker_tasks:
+            return
+        worker_count = getattr(self.settings, "WORKFLOW_WORKERS", DEFAULT_WORKFLOW_WORKERS)
+        self._worker_tasks = [
+            asyncio.create_task(self._workflow_worker()) for _ in range(worker_count)
+        ]
+    
+    async def _next_by_priority(self):
+        """Next queued (workflow_id, request), checking critical before emergent, urgent, routine"""
+        while True:
+            for priority in WORKFLOW_PRIORITIES:
+                queue = self.workflow_queues[priority]
+                if not queue.empty():
+                    return queue.get_nowait()
+            self._work_available.clear()
+            await self._work_available.wait()
+    
+    async def _workflow_worker(self):
+        """Process queued workflows one at a time, most urgent first"""
+        while True:
+            workflow_id, request = await self._next_by_priority()
+            workflow = self.active_workflows.get(workflow_id)
+            if workflow is None or workflow.status == WorkflowStatus.CANCELLED:
+                continue
+            await self._process_workflow(workflow_id, request)
+    
     async def _process_workflow(self, workflow_id: str, request: WorkflowRequest):
         """Process workflow through multiple AI agents"""
         workflow = self.active_workflows[workflow_id]
+        # Elapsed time comes from the monotonic clock; wall-clock end_time is
+        # derived from start_time rather than read again
+        started_ns = time.monotonic_ns()
         
         try:
             # Update status
-            workflow.status = WorkflowStatus.INITIALIZING
+            self._set_status(workflow, WorkflowStatus.INITIALIZING)
             await self._broadcast_workflow_update(workflow_id)
             
             # Step 1: Agent Coordination and Planning
-            workflow.status = WorkflowStatus.AGENT_COORDINATION
-            agent_plan = await self._create_agent_execution_plan(request)
+            self._set_status(workflow, WorkflowStatus.AGENT_COORDINATION)
+            agent_plan = self._create_agent_execution_plan(request)
             workflow.processing_steps.append({
                 "step": "agent_planning",
                 "timestamp": datetime.now(timezone.utc),
+                "elapsed_ms": (time.monotonic_ns() - started_ns) // 1_000_000,
                 "agents_selected": agent_plan["agents"],
                 "execution_order": agent_plan["order"]
             })
             await self._broadcast_workflow_update(workflow_id)
             
-            # Step 2: Image Processing (if applicable)
-            if request.imaging_data and "image_analysis" in agent_plan["agents"]:
-                workflow.status = WorkflowStatus.IMAGE_PROCESSING
-                workflow.image_analysis_results = await self._process_imaging_data(
-                    workflow_id, request.imaging_data
-                )
-                workflow.agents_used.append("image_analysis")
-                await self._broadcast_workflow_update(workflow_id)
-            
-            # Step 3: Medical History Analysis
-            if request.medical_history and "history_synthesis" in agent_plan["agents"]:
-                workflow.status = WorkflowStatus.HISTORY_ANALYSIS
-                workflow.history_synthesis_results = await self._process_medical_history(
-                    workflow_id, request.patient_id, request.medical_history
-                )
-                workflow.agents_used.append("history_synthesis")
-                await self._broadcast_workflow_update(workflow_id)
-            
-            # Step 4: Drug Interaction Analysis
-            if request.medications and "drug_interaction" in agent_plan["agents"]:
-                workflow.status = WorkflowStatus.DRUG_CHECKING
-                workflow.drug_interaction_results = await self._process_drug_interactions(
-                    workflow_id, request.medications, request.medical_history
-                )
-                workflow.agents_used.append("drug_interaction")
-                await self._broadcast_workflow_update(workflow_id)
-            
-            # Step 5: Research and Evidence Synthesis
-            if request.research_protocols_enabled and "research" in agent_plan["agents"]:
-                workflow.status = WorkflowStatus.RESEARCH_SYNTHESIS
-                workflow.research_results = await self._process_research_synthesis(
-                    workflow_id, request
-                )
-                workflow.agents_used.append("research")
-                await self._broadcast_workflow_update(workflow_id)
-            
-            # Step 6: Clinical Decision Support
-            if "clinical_decision" in agent_plan["agents"]:
-                workflow.status = WorkflowStatus.CLINICAL_ANALYSIS
-                workflow.clinical_decision_results = await self._process_clinical_decisions(
-                    workflow_id, workflow, request
-                )
-                workflow.agents_used.append("clinical_decision")
-                await self._broadcast_workflow_update(workflow_id)
-            
-            # Step 7: Precision Medicine (if applicable)
-            if "precision_medicine" in agent_plan["agents"]:
-                workflow.precision_medicine_results = await self._process_precision_medicine(
-                    workflow_id, request
-                )
-                workflow.agents_used.append("precision_medicine")
+            # Steps 2-7: run the agent groups in plan order; agents within a
+            # group are independent and run concurrently
+            for group in self._execution_groups(agent_plan):
+                steps = []
+                for agent_name in group:
+                    coro = self._agent_step(agent_name, workflow_id, workflow, request)
+                    if coro is not None:
+                        steps.append((agent_name, coro))
+                if not steps:
+                    continue
+                
+                step_status = AGENT_STEPS[steps[0][0]][0]
+                if step_status is not None:
+                    self._set_status(workflow, step_status)
+                
+                results = await asyncio.gather(*(coro for _, coro in steps), return_exceptions=True)
+                for (agent_name, _), result in zip(steps, results):
+                    if isinstance(result, Exception):
+                        logger.error("❌ Agent %s failed for workflow %s: %s", agent_name, workflow_id, result)
+                        result = {"error": str(result)}
+                    setattr(workflow, AGENT_STEPS[agent_name][1], result)
+                    workflow.agent_mask |= AGENT_MASKS[agent_name]
+                    if agent_name == "drug_interaction" and result and not result.get("error"):
+                        workflow.quality_flags |= WorkflowFlags.DRUG_CHECKED
+                    elif agent_name == "research" and result and result.get("guidelines_checked"):
+                        workflow.quality_flags |= WorkflowFlags.GUIDELINES_CHECKED
+                
+                if step_status is not None:
+                    await self._broadcast_workflow_update(workflow_id)
             
             # Step 8: Comprehensive Analysis and Report Generation
-            workflow.status = WorkflowStatus.REPORT_GENERATION
+            self._set_status(workflow, WorkflowStatus.REPORT_GENERATION)
             await self._generate_comprehensive_analysis(workflow_id, workflow, request)
             await self._broadcast_workflow_update(workflow_id)
             
             # Finalize workflow
-            workflow.status = WorkflowStatus.COMPLETED
-            workflow.end_time = datetime.now(timezone.utc)
-            workflow.processing_time_ms = (workflow.end_time - workflow.start_time).total_seconds() * 1000
+            self._set_status(workflow, WorkflowStatus.COMPLETED)
+            elapsed_ns = time.monotonic_ns() - started_ns
+            workflow.end_time = workflow.start_time + timedelta(microseconds=elapsed_ns // 1000)
+            workflow.processing_time_ms = elapsed_ns / 1e6
             
             # Store results in database
             await self._store_workflow_results(workflow_id, workflow)
@@ -313,70 +710,91 @@ class UltraAdvancedWorkflowCoordinator:
             # Final update
             await self._broadcast_workflow_update(workflow_id)
             
-            logger.info(f"✅ Workflow {workflow_id} completed successfully")
+            logger.info("✅ Workflow %s completed successfully", workflow_id)
             
         except Exception as e:
-            logger.error(f"❌ Workflow {workflow_id} failed: {e}")
-            workflow.status = WorkflowStatus.ERROR
+            logger.error("❌ Workflow %s failed: %s", workflow_id, e)
+            self._set_status(workflow, WorkflowStatus.ERROR)
             workflow.error_message = str(e)
-            workflow.end_time = datetime.now(timezone.utc)
+            workflow.end_time = workflow.start_time + timedelta(
+                microseconds=(time.monotonic_ns() - started_ns) // 1000
+            )
             await self._broadcast_workflow_update(workflow_id)
     
-    async def _create_agent_execution_plan(self, request: WorkflowRequest) -> Dict[str, Any]:
+    def _execution_groups(self, agent_plan: Mapping[str, Any]) -> List[List[str]]:
+        """Ordered agent groups; planned agents missing from the order join the first group"""
+        ordered = [agent for group in agent_plan["order"] for agent in group]
+        extras = [agent for agent in agent_plan["agents"] if agent not in ordered]
+        groups = [list(group) for group in agent_plan["order"]]
+        if extras:
+            if groups:
+                groups[0] = extras + groups[0]
+            else:
+                groups.append(extras)
+        _check_group_order(groups)
+        return groups
+    
+    def _agent_step(self, agent_name: str, workflow_id: str, workflow: WorkflowResult,
+                    request: WorkflowRequest):
+        """Coroutine for one agent step, or None when the request lacks its input data"""
+        if agent_name == "image_analysis" and request.imaging_data:
+            return self._process_imaging_data(workflow_id, request.imaging_data)
+        if agent_name == "history_synthesis" and request.medical_history:
+            return self._process_medical_history(workflow_id, request.patient_id, request.medical_history)
+        if agent_name == "drug_interaction" and request.medications:
+            return self._process_drug_interactions(workflow_id, request.medications, request.medical_history)
+        if agent_name == "research" and request.research_protocols_enabled:
+            return self._process_research_synthesis(workflow_id, request)
+        if agent_name == "clinical_decision":
+            return self._process_clinical_decisions(workflow_id, workflow, request)
+        if agent_name == "precision_medicine":
+            return self._process_precision_medicine(workflow_id, request)
+        return None
+    
+    def _create_agent_execution_plan(self, request: WorkflowRequest) -> Mapping[str, Any]:
         """Create optimal agent execution plan based on request"""
-        plan = {
-            "agents": [],
-            "order": [],
-            "parallel_groups": [],
-            "dependencies": {}
-        }
-        
-        # Determine which agents to use based on workflow type and available data
-        if request.workflow_type == WorkflowType.AI_DIAGNOSIS:
-            plan["agents"] = ["image_analysis", "history_synthesis", "drug_interaction", "research", "clinical_decision"]
-            plan["order"] = [
-                ["image_analysis", "history_synthesis"],  # Parallel
-                ["drug_interaction"],
-                ["research"],
-                ["clinical_decision"]
-            ]
-        elif request.workflow_type == WorkflowType.IMAGE_ANALYSIS:
-            plan["agents"] = ["image_analysis", "research"]
-            plan["order"] = [["image_analysis"], ["research"]]
-        elif request.workflow_type == WorkflowType.CLINICAL_DECISION_SUPPORT:
-            plan["agents"] = ["history_synthesis", "drug_interaction", "clinical_decision", "research"]
-            plan["order"] = [
-                ["history_synthesis", "drug_interaction"],
-                ["clinical_decision"],
-                ["research"]
-            ]
-        elif request.workflow_type == WorkflowType.PRECISION_MEDICINE:
-            plan["agents"] = ["history_synthesis", "drug_interaction", "research", "precision_medicine"]
-            plan["order"] = [
-                ["history_synthesis", "drug_interaction"],
-                ["research"],
-                ["precision_medicine"]
-            ]
+        plan = STATIC_AGENT_PLANS.get(request.workflow_type, EMPTY_AGENT_PLAN)
+        agents = plan["agents"]
         
         # Add optional agents based on data availability
-        if request.imaging_data and "image_analysis" not in plan["agents"]:
-            plan["agents"].insert(0, "image_analysis")
+        add_imaging = bool(request.imaging_data) and "image_analysis" not in agents
+        add_drugs = bool(request.medications) and "drug_interaction" not in agents
+        if not (add_imaging or add_drugs):
+            return plan
         
-        if request.medications and "drug_interaction" not in plan["agents"]:
-            plan["agents"].append("drug_interaction")
-        
-        return plan
+        return {
+            **plan,
+            "agents": (("image_analysis",) if add_imaging else ())
+                      + agents
+                      + (("drug_interaction",) if add_drugs else ())
+        }
     
     async def _process_imaging_data(self, workflow_id: str, imaging_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process medical imaging data through image analysis agent"""
         try:
             agent = self.agents["image_analysis"]
-            results = []
             
-            for image_data in imaging_data:
-                # Process each image
-                result = await agent.analyze_comprehensive(image_data)
-                results.append(result)
+            # Analyze images concurrently, capped to bound GPU/memory pressure
+            semaphore = asyncio.Semaphore(
+                getattr(self.settings, "IMAGE_ANALYSIS_CONCURRENCY", DEFAULT_IMAGE_ANALYSIS_CONCURRENCY)
+            )
+            
+            async def analyze(image_data: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await agent.analyze_comprehensive(image_data)
+            
+            outcomes = await asyncio.gather(*(analyze(image_data) for image_data in imaging_data),
+                                            return_exceptions=True)
+            
+            results = []
+            workflow = self.active_workflows.get(workflow_id)
+            for index, outcome in enumerate(outcomes):
+                if isinstance(outcome, Exception):
+                    logger.warning("⚠️ Image %s failed for workflow %s: %s", index, workflow_id, outcome)
+                    if workflow is not None:
+                        workflow.warnings.append(f"Image {index} analysis failed: {outcome}")
+                    continue
+                results.append(outcome)
             
             # Aggregate results
             aggregated_results = {
@@ -390,7 +808,7 @@ class UltraAdvancedWorkflowCoordinator:
             return aggregated_results
             
         except Exception as e:
-            logger.error(f"❌ Image processing failed for workflow {workflow_id}: {e}")
+            logger.error("❌ Image processing failed for workflow %s: %s", workflow_id, e)
             return {"error": str(e), "results": []}
     
     async def _process_medical_history(self, workflow_id: str, patient_id: str, medical_history: Dict[str, Any]) -> Dict[str, Any]:
@@ -410,7 +828,7 @@ class UltraAdvancedWorkflowCoordinator:
             return results
             
         except Exception as e:
-            logger.error(f"❌ History synthesis failed for workflow {workflow_id}: {e}")
+            logger.error("❌ History synthesis failed for workflow %s: %s", workflow_id, e)
             return {"error": str(e)}
     
     async def _process_drug_interactions(self, workflow_id: str, medications: List[Dict[str, Any]], medical_history: Dict[str, Any]) -> Dict[str, Any]:
@@ -430,7 +848,7 @@ class UltraAdvancedWorkflowCoordinator:
             return results
             
         except Exception as e:
-            logger.error(f"❌ Drug interaction analysis failed for workflow {workflow_id}: {e}")
+            logger.error("❌ Drug interaction analysis failed for workflow %s: %s", workflow_id, e)
             return {"error": str(e)}
     
     async def _process_research_synthesis(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
@@ -456,7 +874,7 @@ class UltraAdvancedWorkflowCoordinator:
             return results
             
         except Exception as e:
-            logger.error(f"❌ Research synthesis failed for workflow {workflow_id}: {e}")
+            logger.error("❌ Research synthesis failed for workflow %s: %s", workflow_id, e)
             return {"error": str(e)}
     
     async def _process_clinical_decisions(self, workflow_id: str, workflow: WorkflowResult, request: WorkflowRequest) -> Dict[str, Any]:
@@ -488,7 +906,7 @@ class UltraAdvancedWorkflowCoordinator:
             return results
             
         except Exception as e:
-            logger.error(f"❌ Clinical decision support failed for workflow {workflow_id}: {e}")
+            logger.error("❌ Clinical decision support failed for workflow %s: %s", workflow_id, e)
             return {"error": str(e)}
     
     async def _process_precision_medicine(self, workflow_id: str, request: WorkflowRequest) -> Dict[str, Any]:
@@ -508,7 +926,7 @@ class UltraAdvancedWorkflowCoordinator:
             return results
             
         except Exception as e:
-            logger.error(f"❌ Precision medicine analysis failed for workflow {workflow_id}: {e}")
+            logger.error("❌ Precision medicine analysis failed for workflow %s: %s", workflow_id, e)
             return {"error": str(e)}
     
     async def _generate_comprehensive_analysis(self, workflow_id: str, workflow: WorkflowResult, request: WorkflowRequest):
@@ -527,29 +945,37 @@ class UltraAdvancedWorkflowCoordinator:
             # Process clinical decision results
             if workflow.clinical_decision_results:
                 clinical_findings = workflow.clinical_decision_results.get("primary_diagnosis", {})
+                clinical_confidence = clinical_findings.get("confidence", 0.0)
                 if clinical_findings:
                     all_findings.append({
                         "source": "clinical_decision",
                         "finding": clinical_findings.get("diagnosis", ""),
-                        "confidence": clinical_findings.get("confidence", 0.0),
+                        "confidence": clinical_confidence,
                         "evidence_level": clinical_findings.get("evidence_level", "")
                     })
-                confidence_scores["clinical_decision"] = clinical_findings.get("confidence", 0.0)
+                confidence_scores["clinical_decision"] = clinical_confidence
+            
+            # Rank findings once for both the primary and differential diagnosis
+            aggregate = _aggregate_findings(all_findings)
             
             # Generate primary diagnosis
-            primary_diagnosis = await self._determine_primary_diagnosis(all_findings, workflow, request)
+            primary_diagnosis = await self._determine_primary_diagnosis(aggregate, workflow, request)
             workflow.primary_diagnosis = primary_diagnosis
             
             # Generate differential diagnosis
-            differential_diagnosis = await self._generate_differential_diagnosis(all_findings, workflow, request)
+            differential_diagnosis = await self._generate_differential_diagnosis(aggregate, workflow, request)
             workflow.differential_diagnosis = differential_diagnosis
             
             # Calculate overall confidence
             workflow.confidence_scores = confidence_scores
-            workflow.ai_confidence = np.mean(list(confidence_scores.values())) if confidence_scores else 0.0
+            # Plain arithmetic: NumPy's per-call overhead dominates for a handful of agents
+            workflow.ai_confidence = (sum(confidence_scores.values()) / len(confidence_scores)
+                                      if confidence_scores else 0.0)
             
             # Generate treatment recommendations
             workflow.treatment_recommendations = await self._generate_treatment_recommendations(workflow, request)
+            if workflow.treatment_recommendations:
+                workflow.quality_flags |= WorkflowFlags.HAS_TREATMENT
             
             # Generate follow-up recommendations
             workflow.follow_up_recommendations = await self._generate_follow_up_recommendations(workflow, request)
@@ -561,41 +987,42 @@ class UltraAdvancedWorkflowCoordinator:
             workflow.safety_alerts = await self._generate_safety_alerts(workflow, request)
             
         except Exception as e:
-            logger.error(f"❌ Comprehensive analysis failed for workflow {workflow_id}: {e}")
+            logger.error("❌ Comprehensive analysis failed for workflow %s: %s", workflow_id, e)
             workflow.warnings.append(f"Comprehensive analysis incomplete: {e}")
     
-    async def _determine_primary_diagnosis(self, findings: List[Dict[str, Any]], workflow: WorkflowResult, request: WorkflowRequest) -> Dict[str, Any]:
+    async def _determine_primary_diagnosis(self, aggregate: FindingsAggregate, workflow: WorkflowResult, request: WorkflowRequest) -> Dict[str, Any]:
         """Determine primary diagnosis from all findings"""
-        if not findings:
+        if not aggregate.ranked:
             return {"diagnosis": "Insufficient data for diagnosis", "confidence": 0.0}
         
         # Simple algorithm - in real implementation, this would be much more sophisticated
-        highest_confidence_finding = max(findings, key=lambda x: x.get("confidence", 0.0))
+        highest_confidence_finding = aggregate.ranked[0]
+        finding_text = highest_confidence_finding.get("finding")
         
         return {
-            "diagnosis": highest_confidence_finding.get("finding", "Unknown"),
+            "diagnosis": "Unknown" if finding_text is None else finding_text,
             "confidence": highest_confidence_finding.get("confidence", 0.0),
-            "icd_10_code": await self._get_icd10_code(highest_confidence_finding.get("finding", "")),
+            "icd_10_code": await self._get_icd10_code(finding_text or ""),
             "evidence_level": highest_confidence_finding.get("evidence_level", ""),
-            "supporting_agents": [f["source"] for f in findings if f.get("confidence", 0) > 0.7]
+            "supporting_agents": aggregate.supporting_sources
         }
     
-    async def _generate_differential_diagnosis(self, findings: List[Dict[str, Any]], workflow: WorkflowResult, request: WorkflowRequest) -> List[Dict[str, Any]]:
+    async def _generate_differential_diagnosis(self, aggregate: FindingsAggregate, workflow: WorkflowResult, request: WorkflowRequest) -> List[Dict[str, Any]]:
         """Generate differential diagnosis list"""
-        # Sort findings by confidence and return top alternatives
-        sorted_findings = sorted(findings, key=lambda x: x.get("confidence", 0.0), reverse=True)
+        # The first ranked finding is the primary diagnosis
+        top_findings = aggregate.ranked
         
-        differential = []
-        for i, finding in enumerate(sorted_findings[1:6]):  # Top 5 alternatives
-            differential.append({
+        # Top 5 alternatives
+        return [
+            {
                 "diagnosis": finding.get("finding", ""),
                 "confidence": finding.get("confidence", 0.0),
-                "rank": i + 2,
+                "rank": rank,
                 "evidence_level": finding.get("evidence_level", ""),
                 "supporting_evidence": finding.get("evidence", [])
-            })
-        
-        return differential
+            }
+            for rank, finding in enumerate(top_findings[1:6], start=2)
+        ]
     
     async def _generate_treatment_recommendations(self, workflow: WorkflowResult, request: WorkflowRequest) -> List[Dict[str, Any]]:
         """Generate evidence-based treatment recommendations"""
@@ -655,73 +1082,48 @@ class UltraAdvancedWorkflowCoordinator:
     async def _assess_guidelines_adherence(self, workflow: WorkflowResult, request: WorkflowRequest) -> float:
         """Assess adherence to clinical guidelines"""
         # Simplified assessment - in real implementation, this would check against actual guidelines
-        adherence_score = 0.0
-        
-        if workflow.treatment_recommendations:
-            adherence_score += 0.4  # Has treatment recommendations
-        
-        if workflow.drug_interaction_results and not workflow.drug_interaction_results.get("error"):
-            adherence_score += 0.3  # Drug interactions checked
-        
-        if workflow.research_results and workflow.research_results.get("guidelines_checked"):
-            adherence_score += 0.3  # Guidelines reviewed
+        flags = workflow.quality_flags
+        adherence_score = (
+            0.4 * bool(flags & WorkflowFlags.HAS_TREATMENT)
+            + 0.3 * bool(flags & WorkflowFlags.DRUG_CHECKED)
+            + 0.3 * bool(flags & WorkflowFlags.GUIDELINES_CHECKED)
+        )
         
         return min(adherence_score, 1.0)
     
     async def _generate_safety_alerts(self, workflow: WorkflowResult, request: WorkflowRequest) -> List[Dict[str, Any]]:
         """Generate critical safety alerts"""
-        alerts = []
+        # Drug interaction and clinical decision alerts, then the low confidence alert
+        drug_alerts = (workflow.drug_interaction_results or {}).get("safety_alerts") or ()
+        clinical_alerts = (workflow.clinical_decision_results or {}).get("safety_alerts") or ()
+        low_confidence_alerts = LOW_CONFIDENCE_ALERTS if workflow.ai_confidence < 0.7 else ()
         
-        # Drug interaction alerts
-        if workflow.drug_interaction_results:
-            drug_alerts = workflow.drug_interaction_results.get("safety_alerts", [])
-            alerts.extend(drug_alerts)
-        
-        # Clinical decision alerts
-        if workflow.clinical_decision_results:
-            clinical_alerts = workflow.clinical_decision_results.get("safety_alerts", [])
-            alerts.extend(clinical_alerts)
-        
-        # Low confidence alerts
-        if workflow.ai_confidence < 0.7:
-            alerts.append({
-                "level": "warning",
-                "message": "Low AI confidence detected - consider additional diagnostic workup",
-                "recommendation": "Seek specialist consultation"
-            })
-        
-        return alerts
+        return [*drug_alerts, *clinical_alerts, *low_confidence_alerts]
     
     async def _get_icd10_code(self, diagnosis: str) -> str:
         """Get ICD-10 code for diagnosis (simplified)"""
-        # In real implementation, this would use a proper medical coding system
-        icd10_mapping = {
-            "pneumonia": "J18.9",
-            "pleural effusion": "J94.8",
-            "consolidation": "J18.9",
-            "atelectasis": "J98.11"
-        }
-        
-        for condition, code in icd10_mapping.items():
-            if condition in diagnosis.lower():
-                return code
-        
-        return "Z00.00"  # General examination code
+        return _lookup_icd10_code(diagnosis)
     
     async def _consolidate_imaging_findings(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Consolidate findings from multiple images"""
         consolidated = []
         
         for result in results:
-            findings = result.get("findings", [])
-            for finding in findings:
-                consolidated.append({
+            findings = result.get("findings")
+            if not findings:
+                continue
+            image_source = result.get("filename", "")  # shared by all of this image's findings
+            consolidated.extend(
+                {
+                    "source": "image_analysis",
                     "finding": finding.get("description", ""),
                     "confidence": finding.get("confidence", 0.0),
                     "location": finding.get("coordinates", []),
                     "severity": finding.get("severity", ""),
-                    "image_source": result.get("filename", "")
-                })
+                    "image_source": image_source
+                }
+                for finding in findings
+            )
         
         return consolidated
     
@@ -730,132 +1132,235 @@ class UltraAdvancedWorkflowCoordinator:
         if not results:
             return {"overall_confidence": 0.0}
         
-        confidences = []
-        for result in results:
-            findings = result.get("findings", [])
-            for finding in findings:
-                confidences.append(finding.get("confidence", 0.0))
+        # One pass over the findings into an array; every statistic reads the same buffer
+        confidences = np.fromiter(
+            (finding.get("confidence", 0.0) for result in results for finding in result.get("findings", [])),
+            dtype=np.float64
+        )
         
-        if not confidences:
+        if confidences.size == 0:
             return {"overall_confidence": 0.0}
         
+        if NUMBA_AVAILABLE and confidences.size >= NUMBA_MIN_FINDINGS:
+            mean, lowest, highest, std = _reduce_confidences(confidences)
+        else:
+            mean, lowest, highest, std = confidences.mean(), confidences.min(), confidences.max(), confidences.std()
+        
         return {
-            "overall_confidence": np.mean(confidences),
-            "max_confidence": max(confidences),
-            "min_confidence": min(confidences),
-            "std_confidence": np.std(confidences),
-            "total_findings": len(confidences)
+            "overall_confidence": float(mean),
+            "max_confidence": float(highest),
+            "min_confidence": float(lowest),
+            "std_confidence": float(std),
+            "total_findings": int(confidences.size)
         }
     
     async def _assess_imaging_quality(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Assess overall quality of imaging results"""
-        quality_scores = []
-        
-        for result in results:
-            quality_assessment = result.get("quality_assessment", {})
-            quality_scores.append(quality_assessment.get("overall_quality", 0.0))
+        quality_scores = np.fromiter(
+            (result.get("quality_assessment", {}).get("overall_quality", 0.0) for result in results),
+            dtype=np.float64
+        )
         
-        if not quality_scores:
+        if quality_scores.size == 0:
             return {"overall_quality": 0.0}
         
+        # Bucket every score in one pass: poor < 0.5 <= fair < 0.7 <= good < 0.9 <= excellent
+        poor, fair, good, excellent = np.bincount(
+            np.digitize(quality_scores, QUALITY_BUCKET_EDGES), minlength=4
+        ).tolist()
+        
         return {
-            "overall_quality": np.mean(quality_scores),
-            "images_processed": len(quality_scores),
+            "overall_quality": float(quality_scores.mean()),
+            "images_processed": int(quality_scores.size),
             "quality_distribution": {
-                "excellent": sum(1 for q in quality_scores if q >= 0.9),
-                "good": sum(1 for q in quality_scores if 0.7 <= q < 0.9),
-                "fair": sum(1 for q in quality_scores if 0.5 <= q < 0.7),
-                "poor": sum(1 for q in quality_scores if q < 0.5)
+                "excellent": excellent,
+                "good": good,
+                "fair": fair,
+                "poor": poor
             }
         }
     
     async def _store_workflow_results(self, workflow_id: str, workflow: WorkflowResult):
         """Store workflow results in database"""
         try:
-            collection = self.db.workflows
-            
             # Convert to dictionary for storage
-            workflow_dict = asdict(workflow)
-            
-            # Convert datetime objects to ISO format
-            if workflow_dict["start_time"]:
-                workflow_dict["start_time"] = workflow_dict["start_time"].isoformat()
-            if workflow_dict["end_time"]:
-                workflow_dict["end_time"] = workflow_dict["end_time"].isoformat()
+            workflow_dict = workflow.to_document()
             
-            # Store in database
-            await collection.insert_one(workflow_dict)
-            
-            logger.info(f"✅ Workflow {workflow_id} results stored in database")
+            # Queue for the next bulk insert
+            self._pending_results.append(workflow_dict)
+            if len(self._pending_results) >= RESULTS_BATCH_SIZE:
+                await self._flush_workflow_results()
+            else:
+                self._results_ready.set()
+                if self._results_flush_task is None or self._results_flush_task.done():
+                    self._results_flush_task = asyncio.create_task(self._results_flush_loop())
             
         except Exception as e:
-            logger.error(f"❌ Failed to store workflow {workflow_id} results: {e}")
+            logger.error("❌ Failed to store workflow %s results: %s", workflow_id, e)
+    
+    async def _results_flush_loop(self):
+        """Bulk-insert queued workflow results at most every RESULTS_FLUSH_INTERVAL_SECONDS"""
+        while True:
+            await self._results_ready.wait()
+            await asyncio.sleep(RESULTS_FLUSH_INTERVAL_SECONDS)
+            self._results_ready.clear()
+            await self._flush_workflow_results()
+    
+    async def _flush_workflow_results(self):
+        """Write all queued workflow results as summary and blob documents, one insert_many each"""
+        if not self._pending_results:
+            return
+        batch, self._pending_results = self._pending_results, []
+        summaries = [{name: document[name] for name in WORKFLOW_SUMMARY_FIELDS} for document in batch]
+        blobs = [
+            {name: value for name, value in document.items() if name not in _SUMMARY_ONLY_FIELDS}
+            for document in batch
+        ]
+        await asyncio.gather(
+            self._insert_workflow_documents(self.db.workflows, summaries, "workflow summaries"),
+            self._insert_workflow_documents(self.db.workflow_blobs, blobs, "workflow blobs")
+        )
+    
+    async def _insert_workflow_documents(self, collection, documents: List[Dict[str, Any]], label: str):
+        """Unordered insert_many that logs partial failures"""
+        try:
+            await collection.insert_many(documents, ordered=False)
+            logger.info("✅ Stored %s %s in database", len(documents), label)
+        except BulkWriteError as e:
+            # Unordered: every document without an error was still written
+            details = e.details
+            logger.error("❌ Stored %s of %s %s; %s failed: %s",
+                         details.get("nInserted", 0), len(documents), label,
+                         len(details.get("writeErrors", [])), details.get("writeErrors", [])[:3])
+        except Exception as e:
+            logger.error("❌ Failed to store %s %s: %s", len(documents), label, e)
     
     async def _broadcast_workflow_update(self, workflow_id: str):
-        """Broadcast workflow status update to connected clients"""
+        """Mark a workflow as changed; the broadcast loop publishes its latest state"""
+        if workflow_id not in self.active_workflows:
+            return
+        self._dirty_workflows.add(workflow_id)
+        self._broadcast_event.set()
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+    
+    def _build_workflow_update(self, workflow: WorkflowResult, timestamp: datetime) -> Dict[str, Any]:
+        """Status update message for one workflow"""
+        return {
+            "type": "workflow_update",
+            "workflow_id": workflow.workflow_id,
+            "status": _STATUS_STR[workflow.status],
+            "progress": self._calculate_progress(workflow),
+            "agents_used": workflow.agents_used,
+            "current_step": self._get_current_step(workflow),
+            "timestamp": timestamp
+        }
+    
+    async def _broadcast_loop(self):
+        """Publish changed workflows once per debounce window"""
+        while True:
+            await self._broadcast_event.wait()
+            await asyncio.sleep(BROADCAST_DEBOUNCE_SECONDS)
+            self._broadcast_event.clear()
+            await self._flush_workflow_updates()
+    
+    async def _flush_workflow_updates(self):
+        """Prune dead clients, then publish changed workflows to Redis and clients (one frame each)"""
+        if self._dead_clients:
+            await self._prune_dead_clients()
+        if not self._dirty_workflows:
+            return
+        workflow_ids, self._dirty_workflows = self._dirty_workflows, set()
         try:
-            workflow = self.active_workflows.get(workflow_id)
-            if not workflow:
+            # One clock read per flush; skew is bounded by the debounce window
+            now = datetime.now(timezone.utc)
+            updates = [
+                self._build_workflow_update(self.active_workflows[workflow_id], now)
+                for workflow_id in workflow_ids
+                if workflow_id in self.active_workflows
+            ]
+            if self.redis is not None:
+                await self._mirror_updates_to_redis(updates)
+            if self.websocket_connections:
+                self._broadcast_payload(_encode_json({"type": "workflow_batch", "updates": updates}), updates)
+        except Exception as e:
+            logger.error("❌ Failed to broadcast workflow updates: %s", e)
+    
+    def _broadcast_payload(self, payload: str, updates: List[Dict[str, Any]]):
+        """Hand a batch to every client's writer; a full queue drops its oldest batch"""
+        for queue in tuple(self._client_queues.values()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait((payload, updates))
+    
+    async def _client_writer(self, user_id: str, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued batches to one client, merging any that piled up while it was busy"""
+        while True:
+            batches = [await queue.get()]
+            while not queue.empty():
+                batches.append(queue.get_nowait())
+            
+            if len(batches) == 1:
+                payload = batches[0][0]
+            else:
+                # Latest update per workflow wins across the merged batches
+                latest = {}
+                for _, updates in batches:
+                    for update in updates:
+                        latest[update["workflow_id"]] = update
+                payload = _encode_json({"type": "workflow_batch", "updates": list(latest.values())})
+            
+            try:
+                await asyncio.wait_for(websocket.send_text(payload), timeout=WS_SEND_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.debug("Failed to send update to user %s: %r", user_id, e)
+                self._dead_clients.append((user_id, websocket))
+                self._broadcast_event.set()  # the broadcast loop prunes it
                 return
-            
-            # Create update message
-            update = {
-                "type": "workflow_update",
-                "workflow_id": workflow_id,
-                "status": workflow.status.value,
-                "progress": self._calculate_progress(workflow),
-                "agents_used": workflow.agents_used,
-                "current_step": self._get_current_step(workflow),
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Broadcast to all connected clients
-            for user_id, websocket in self.websocket_connections.items():
-                try:
-                    await websocket.send_text(json.dumps(update))
-                except Exception as e:
-                    logger.warning(f"Failed to send update to user {user_id}: {e}")
-            
+    
+    async def _mirror_updates_to_redis(self, updates: List[Dict[str, Any]]):
+        """Send every update as SETEX + PUBLISH in a single round trip"""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for update in updates:
+                    payload = _encode_json(update)
+                    pipe.setex(f"workflow_status:{update['workflow_id']}", WORKFLOW_STATUS_TTL_SECONDS, payload)
+                    pipe.publish(WORKFLOW_UPDATES_CHANNEL, payload)
+                await pipe.execute()
         except Exception as e:
-            logger.error(f"❌ Failed to broadcast workflow update: {e}")
+            logger.warning("⚠️ Failed to mirror %s workflow updates to Redis: %s", len(updates), e)
+    
+    async def shutdown(self):
+        """Stop background tasks and flush any staged updates and results"""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        
+        for task_attr in ("_broadcast_task", "_results_flush_task"):
+            task = getattr(self, task_attr)
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                setattr(self, task_attr, None)
+        await self._flush_workflow_updates()
+        await self._flush_workflow_results()
+        
+        writers = list(self._client_writers.values())
+        for writer in writers:
+            writer.cancel()
+        await asyncio.gather(*writers, return_exceptions=True)
     
     def _calculate_progress(self, workflow: WorkflowResult) -> float:
         """Calculate workflow progress percentage"""
-        status_progress = {
-            WorkflowStatus.PENDING: 0,
-            WorkflowStatus.INITIALIZING: 10,
-            WorkflowStatus.AGENT_COORDINATION: 20,
-            WorkflowStatus.IMAGE_PROCESSING: 35,
-            WorkflowStatus.HISTORY_ANALYSIS: 50,
-            WorkflowStatus.DRUG_CHECKING: 65,
-            WorkflowStatus.RESEARCH_SYNTHESIS: 75,
-            WorkflowStatus.CLINICAL_ANALYSIS: 85,
-            WorkflowStatus.REPORT_GENERATION: 95,
-            WorkflowStatus.COMPLETED: 100,
-            WorkflowStatus.ERROR: 0,
-            WorkflowStatus.CANCELLED: 0
-        }
-        
-        return status_progress.get(workflow.status, 0)
+        return _STATUS_PROGRESS.get(workflow.status, 0)
     
     def _get_current_step(self, workflow: WorkflowResult) -> str:
         """Get human-readable current step description"""
-        step_descriptions = {
-            WorkflowStatus.PENDING: "Workflow queued",
-            WorkflowStatus.INITIALIZING: "Initializing AI agents",
-            WorkflowStatus.AGENT_COORDINATION: "Coordinating multi-agent analysis",
-            WorkflowStatus.IMAGE_PROCESSING: "Processing medical images with MONAI AI",
-            WorkflowStatus.HISTORY_ANALYSIS: "Analyzing patient medical history",
-            WorkflowStatus.DRUG_CHECKING: "Checking drug interactions and safety",
-            WorkflowStatus.RESEARCH_SYNTHESIS: "Synthesizing research evidence",
-            WorkflowStatus.CLINICAL_ANALYSIS: "Generating clinical recommendations",
-            WorkflowStatus.REPORT_GENERATION: "Generating comprehensive report",
-            WorkflowStatus.COMPLETED: "Analysis complete",
-            WorkflowStatus.ERROR: "Error occurred",
-            WorkflowStatus.CANCELLED: "Workflow cancelled"
-        }
-        
-        return step_descriptions.get(workflow.status, "Unknown status")
+        return _STATUS_STEPS.get(workflow.status, "Unknown status")
     
     async def get_workflow_status(self, workflow_id: str) -> Optional[WorkflowResult]:
         """Get current workflow status"""
@@ -873,34 +1378,64 @@ class UltraAdvancedWorkflowCoordinator:
                 return False
             
             # Cancel workflow
-            workflow.status = WorkflowStatus.CANCELLED
+            self._set_status(workflow, WorkflowStatus.CANCELLED)
             workflow.end_time = datetime.now(timezone.utc)
             
             # Broadcast update
             await self._broadcast_workflow_update(workflow_id)
             
-            logger.info(f"🛑 Workflow {workflow_id} cancelled by user {user_id}")
+            logger.info("🛑 Workflow %s cancelled by user %s", workflow_id, user_id)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to cancel workflow {workflow_id}: {e}")
+            logger.error("❌ Failed to cancel workflow %s: %s", workflow_id, e)
             return False
     
     async def register_websocket(self, user_id: str, websocket: WebSocket):
         """Register WebSocket connection for real-time updates"""
-        self.websocket_connections[user_id] = websocket
-        logger.info(f"🔌 WebSocket registered for user {user_id}")
+        async with self._ws_lock:
+            previous_writer = self._client_writers.pop(user_id, None)
+            if previous_writer is not None:
+                previous_writer.cancel()
+            queue = asyncio.Queue(maxsize=WS_CLIENT_QUEUE_SIZE)
+            self.websocket_connections[user_id] = websocket
+            self._client_queues[user_id] = queue
+            self._client_writers[user_id] = asyncio.create_task(self._client_writer(user_id, websocket, queue))
+        logger.info("🔌 WebSocket registered for user %s", user_id)
     
     async def unregister_websocket(self, user_id: str):
         """Unregister WebSocket connection"""
-        if user_id in self.websocket_connections:
-            del self.websocket_connections[user_id]
-            logger.info(f"🔌 WebSocket unregistered for user {user_id}")
+        async with self._ws_lock:
+            removed = self._remove_client(user_id)
+        if removed:
+            logger.info("🔌 WebSocket unregistered for user %s", user_id)
+    
+    async def _prune_dead_clients(self):
+        """Drop every client whose writer failed, under a single lock acquisition"""
+        dead, self._dead_clients = self._dead_clients, []
+        async with self._ws_lock:
+            # A user who reconnected since the failure keeps the new connection
+            pruned = sum(self._remove_client(user_id, websocket) for user_id, websocket in dead)
+        if pruned:
+            logger.warning("Pruned %s dead WebSocket clients", pruned)
+    
+    def _remove_client(self, user_id: str, websocket: Optional[WebSocket] = None) -> bool:
+        """Remove a client and stop its writer; the caller holds ``_ws_lock``"""
+        current = self.websocket_connections.get(user_id)
+        if current is None or (websocket is not None and current is not websocket):
+            return False
+        del self.websocket_connections[user_id]
+        del self._client_queues[user_id]
+        self._client_writers.pop(user_id).cancel()
+        return True
     
     async def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
         return {
             "active_workflows": len(self.active_workflows),
+            "status_counts": {
+                status.value: self.count_by_status(status) for status in WorkflowStatus
+            },
             "queue_lengths": {
                 priority: queue.qsize() 
                 for priority, queue in self.workflow_queues.items()
@@ -5,474 +5,637 @@ Complete demonstration of the specialized medical AI agents system
 """
 
 import asyncio
-import json
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import sys
-import os
+import time
 
-# Add backend to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:  # Windows and other unsupported platforms keep the stock loop
+    UVLOOP_AVAILABLE = False
 
-class MultiAgentDemo:
-    def __init__(self):
-        self.demo_patient_data = {
-            "name": "John Doe",
-            "age": 65,
-            "gender": "Male",
-            "medical_history": [
-                "Hypertension",
-                "Type 2 Diabetes",
-                "Previous myocardial infarction (2019)"
-            ],
-            "current_medications": [
-                "Metformin 1000mg twice daily",
-                "Lisinopril 10mg daily",
-                "Aspirin 81mg daily",
-                "Atorvastatin 40mg daily"
-            ],
-            "symptoms": [
-                "Chest pain",
-                "Shortness of breath",
-                "Fatigue"
-            ],
-            "lab_results": {
-                "HbA1c": "7.2%",
-                "Total Cholesterol": "245 mg/dL",
-                "LDL": "165 mg/dL", 
-                "Blood Pressure": "150/95 mmHg",
-                "eGFR": "75 mL/min/1.73m²"
-            },
-            "vital_signs": {
-                "temperature": "98.6°F",
-                "heart_rate": "88 bpm",
-                "respiratory_rate": "18/min",
-                "oxygen_saturation": "96%"
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Static demo fixtures, built once at import and shared read-only across runs
+_PATIENT_DATA = MappingProxyType({
+    "name": "John Doe",
+    "age": 65,
+    "gender": "Male",
+    "medical_history": [
+        "Hypertension",
+        "Type 2 Diabetes",
+        "Previous myocardial infarction (2019)"
+    ],
+    "current_medications": [
+        "Metformin 1000mg twice daily",
+        "Lisinopril 10mg daily",
+        "Aspirin 81mg daily",
+        "Atorvastatin 40mg daily"
+    ],
+    "symptoms": [
+        "Chest pain",
+        "Shortness of breath",
+        "Fatigue"
+    ],
+    "lab_results": {
+        "HbA1c": "7.2%",
+        "Total Cholesterol": "245 mg/dL",
+        "LDL": "165 mg/dL", 
+        "Blood Pressure": "150/95 mmHg",
+        "eGFR": "75 mL/min/1.73m²"
+    },
+    "vital_signs": {
+        "temperature": "98.6°F",
+        "heart_rate": "88 bpm",
+        "respiratory_rate": "18/min",
+        "oxygen_saturation": "96%"
+    }
+})
+
+# Simulated MONAI analysis results
+_IMAGE_RESULTS = MappingProxyType({
+    "analysis_type": "Chest X-Ray Analysis",
+    "model_used": "MONAI DenseNet121",
+    "findings": {
+        "cardiomegaly": {
+            "detected": True,
+            "confidence": 0.87,
+            "severity": "Moderate",
+            "roi_coordinates": [(120, 150), (280, 320)]
+        },
+        "pulmonary_edema": {
+            "detected": True,
+            "confidence": 0.73,
+            "severity": "Mild",
+            "roi_coordinates": [(50, 80), (350, 280)]
+        },
+        "pleural_effusion": {
+            "detected": False,
+            "confidence": 0.23
+        }
+    },
+    "risk_assessment": {
+        "cardiac_risk": "HIGH",
+        "immediate_attention": True,
+        "follow_up_needed": "Echocardiogram within 24 hours"
+    },
+    "explainability": {
+        "attention_heatmap": "Generated visual heatmap highlighting cardiac silhouette",
+        "key_features": ["Enlarged cardiac shadow", "Vascular congestion patterns"],
+        "clinical_correlation": "Findings consistent with congestive heart failure"
+    }
+})
+
+# Simulated drug interaction analysis
+_DRUG_RESULTS = MappingProxyType({
+    "medications_analyzed": len(_PATIENT_DATA['current_medications']),
+    "interactions_found": {
+        "moderate_interactions": [
+            {
+                "drugs": ["Lisinopril", "Aspirin"],
+                "interaction_type": "Moderate",
+                "risk": "Increased risk of hyperkalemia",
+                "recommendation": "Monitor potassium levels regularly",
+                "severity_score": 6
             }
+        ],
+        "contraindications": [],
+        "warnings": [
+            {
+                "drug": "Metformin",
+                "condition": "eGFR <60",
+                "current_egfr": "75 mL/min/1.73m²",
+                "status": "Safe - Monitor kidney function"
+            }
+        ]
+    },
+    "dosage_optimization": {
+        "atorvastatin": {
+            "current_dose": "40mg daily",
+            "recommended_adjustment": "Consider increasing to 80mg given LDL >160",
+            "monitoring": "Liver function tests in 6 weeks"
+        }
+    },
+    "adherence_score": 0.85,
+    "safety_score": "A-"
+})
+
+# Simulated clinical decision support
+_CLINICAL_RESULTS = MappingProxyType({
+    "primary_diagnosis": {
+        "condition": "Acute Coronary Syndrome - NSTEMI",
+        "confidence": 0.78,
+        "evidence_level": "High",
+        "supporting_factors": [
+            "Chest pain with cardiac risk factors",
+            "Abnormal cardiac imaging",
+            "History of previous MI"
+        ]
+    },
+    "risk_stratification": {
+        "grace_score": 142,
+        "risk_category": "High Risk",
+        "30_day_mortality_risk": "8.1%",
+        "recommendation": "Urgent cardiology consultation"
+    },
+    "treatment_recommendations": [
+        {
+            "intervention": "Dual Antiplatelet Therapy",
+            "evidence_grade": "Class I, Level A",
+            "rationale": "Proven mortality benefit in NSTEMI",
+            "duration": "12 months minimum"
+        },
+        {
+            "intervention": "High-intensity Statin",
+            "evidence_grade": "Class I, Level A", 
+            "rationale": "LDL goal <70 mg/dL for secondary prevention",
+            "adjustment": "Increase Atorvastatin to 80mg"
+        },
+        {
+            "intervention": "ACE Inhibitor Optimization",
+            "evidence_grade": "Class I, Level A",
+            "rationale": "Proven benefit post-MI with diabetes",
+            "adjustment": "Monitor kidney function closely"
+        }
+    ],
+    "monitoring_plan": {
+        "immediate": ["Cardiac enzymes q6h x3", "EKG monitoring", "Echocardiogram"],
+        "short_term": ["Stress test in 2-3 days", "Lipid panel in 6 weeks"],
+        "long_term": ["HbA1c q3months", "Annual coronary assessment"]
+    }
+})
+
+# Simulated research findings
+_RESEARCH_RESULTS = MappingProxyType({
+    "relevant_trials": [
+        {
+            "trial_id": "NCT04567890", 
+            "title": "PCSK9 Inhibitors in Post-MI Patients with Diabetes",
+            "phase": "Phase III",
+            "status": "Recruiting",
+            "eligibility_match": 0.89,
+            "location": "Multiple US Centers",
+            "primary_endpoint": "Major adverse cardiovascular events at 2 years"
+        },
+        {
+            "trial_id": "NCT04123456",
+            "title": "AI-Guided Cardiac Rehabilitation in Elderly Diabetics", 
+            "phase": "Phase II",
+            "status": "Recruiting",
+            "eligibility_match": 0.82,
+            "location": "Mayo Clinic",
+            "primary_endpoint": "Functional capacity improvement"
+        }
+    ],
+    "recent_research": [
+        {
+            "title": "2024 Guidelines for Diabetes Management in CAD",
+            "journal": "Journal of the American College of Cardiology",
+            "impact_factor": 24.0,
+            "relevance_score": 0.95,
+            "key_finding": "Intensive glucose control reduces cardiac events by 18%"
+        },
+        {
+            "title": "MONAI Deep Learning for Cardiac Risk Stratification",
+            "journal": "Nature Medicine",
+            "impact_factor": 87.2,
+            "relevance_score": 0.88,
+            "key_finding": "AI imaging analysis improves prognosis prediction by 23%"
+        }
+    ],
+    "evidence_synthesis": {
+        "recommendation_strength": "Strong",
+        "supporting_studies": 47,
+        "meta_analysis_result": "Consistent benefit across populations",
+        "clinical_applicability": "High - directly applicable to patient"
+    }
+})
+
+# Simulated history synthesis
+_HISTORY_RESULTS = MappingProxyType({
+    "timeline_analysis": {
+        "2019": "Myocardial infarction - Started secondary prevention",
+        "2020": "Diabetes diagnosis - Initiated metformin therapy", 
+        "2021": "Hypertension control achieved with Lisinopril",
+        "2022": "Statin therapy optimized for lipid goals",
+        "2023": "Stable course with medication adherence",
+        "2024": "Current presentation with recurrent symptoms"
+    },
+    "risk_factor_progression": {
+        "diabetes_control": {
+            "trend": "Stable but suboptimal",
+            "current_hba1c": "7.2%",
+            "target": "<7.0%",
+            "recommendation": "Consider intensification"
+        },
+        "lipid_management": {
+            "trend": "Inadequate control",
+            "current_ldl": "165 mg/dL",
+            "target": "<70 mg/dL", 
+            "recommendation": "Increase statin intensity"
+        },
+        "blood_pressure": {
+            "trend": "Suboptimal control",
+            "current_bp": "150/95",
+            "target": "<130/80",
+            "recommendation": "Consider combination therapy"
+        }
+    },
+    "medication_adherence_patterns": {
+        "overall_adherence": 0.85,
+        "high_adherence": ["Aspirin", "Metformin"],
+        "moderate_adherence": ["Lisinopril", "Atorvastatin"],
+        "barriers_identified": ["Cost concerns", "Side effect concerns"]
+    },
+    "care_gaps": [
+        "Annual diabetic eye exam overdue by 8 months",
+        "Influenza vaccination not documented", 
+        "Pneumococcal vaccine due",
+        "Colonoscopy screening overdue"
+    ]
+})
+
+# Simulated coordination results
+_COORDINATION_RESULTS = MappingProxyType({
+    "agent_consensus": {
+        "primary_concern": "Acute coronary syndrome with multiple comorbidities",
+        "urgency_level": "HIGH - Immediate intervention required",
+        "confidence_score": 0.84
+    },
+    "cross_agent_correlations": [
+        {
+            "agents": ["Image Analysis", "Clinical Decision"],
+            "finding": "Cardiomegaly on imaging correlates with heart failure risk",
+            "clinical_impact": "Supports urgent echocardiogram"
+        },
+        {
+            "agents": ["Drug Safety", "History Synthesis"],
+            "finding": "Suboptimal adherence affecting risk factor control",
+            "clinical_impact": "Suggests need for medication counseling"
+        },
+        {
+            "agents": ["Research", "Clinical Decision"],
+            "finding": "Patient eligible for clinical trial enrollment",
+            "clinical_impact": "Access to cutting-edge therapies"
         }
+    ],
+    "integrated_recommendations": [
+        "Immediate cardiology consultation with urgent echocardiogram",
+        "Optimize medical therapy per current guidelines",
+        "Enroll in cardiac rehabilitation program",
+        "Consider clinical trial participation",
+        "Implement comprehensive diabetes management",
+        "Address medication adherence barriers"
+    ],
+    "quality_metrics": {
+        "analysis_completeness": 0.94,
+        "evidence_strength": "High",
+        "recommendation_confidence": 0.87,
+        "patient_safety_score": "A+"
+    }
+})
+
+def _encode_json(value):
+    """Serialize a fixture to JSON bytes, unwrapping read-only mappings"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=dict)
+    return json.dumps(value, default=dict).encode()
+
+# Agent results pre-serialized at import so an HTTP layer can send bytes as-is
+_RESULTS_JSON = MappingProxyType({
+    'imaging': _encode_json(_IMAGE_RESULTS),
+    'drug_safety': _encode_json(_DRUG_RESULTS),
+    'clinical_decision': _encode_json(_CLINICAL_RESULTS),
+    'research': _encode_json(_RESEARCH_RESULTS),
+    'history': _encode_json(_HISTORY_RESULTS),
+    'coordination': _encode_json(_COORDINATION_RESULTS)
+})
+
+# Report line templates and pre-titled finding names for the hot print loops
+_FINDING_FMT = "   • {name}: {severity} (Confidence: {confidence:.1%})"
+_RISK_FACTOR_FMT = "   • {name}: {trend}\n     Current: {current}"
+_TREATMENT_FMT = "   • {intervention} ({evidence_grade})\n     {rationale}"
+_RECOMMENDATION_FMT = "   {index}. {text}"
+_FINDING_NAME_CACHE = {
+    key: key.replace('_', ' ').title()
+    for key in (*_IMAGE_RESULTS['findings'], *_HISTORY_RESULTS['risk_factor_progression'])
+}
+
+
+def _run_monai_analysis(patient):
+    """Blocking imaging inference; stands in for the MONAI DenseNet121 predictor"""
+    return _IMAGE_RESULTS
+
+def _check_drug_interactions(medications):
+    """Blocking drug-database lookup for the patient's medication list"""
+    return _DRUG_RESULTS
+
+
+# Repeat analyses of the same patient reuse agent results for this long
+AGENT_CACHE_TTL_SECONDS = 600
+AGENT_CACHE_MAX_ENTRIES = 1024
+_AGENT_CACHE = {}
+
+
+@lru_cache(maxsize=64)
+def _render_header(title, emoji, char):
+    """Render a title line and its underline once per distinct heading"""
+    return f"\n{emoji} {title}\n{char * (len(title) + 4)}"
+
+
+class MultiAgentDemo:
+    def __init__(self):
+        self.demo_patient_data = _PATIENT_DATA
+        # Patient fixtures are static, so their report lines are rendered once
+        self._patient_line = (
+            f"👤 Patient: {self.demo_patient_data['name']} "
+            f"(Age: {self.demo_patient_data['age']}, {self.demo_patient_data['gender']})"
+        )
+        self._symptoms_joined = ", ".join(self.demo_patient_data['symptoms'])
+    
+    def print_header(self, out, title, emoji="🔥"):
+        out.append(_render_header(title, emoji, "="))
+    
+    def print_section(self, out, title, emoji="📊"):
+        out.append(_render_header(title, emoji, "-"))
     
-    def print_header(self, title, emoji="🔥"):
-        print(f"\n{emoji} {title}")
-        print("=" * (len(title) + 4))
+    def _patient_fingerprint(self):
+        """Hashable slice of the patient data the agents actually read"""
+        return (
+            tuple(self.demo_patient_data['current_medications']),
+            tuple(self.demo_patient_data['symptoms']),
+            self.demo_patient_data['age']
+        )
     
-    def print_section(self, title, emoji="📊"):
-        print(f"\n{emoji} {title}")
-        print("-" * (len(title) + 4))
+    async def _cached_result(self, agent, compute):
+        """Return an agent result from the TTL cache, computing it on a miss"""
+        key = (agent, self._patient_fingerprint())
+        now = time.monotonic()
+        entry = _AGENT_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        result = compute()
+        if asyncio.iscoroutine(result):
+            result = await result
+        
+        if key not in _AGENT_CACHE and len(_AGENT_CACHE) >= AGENT_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry; dicts keep insertion order
+            _AGENT_CACHE.pop(next(iter(_AGENT_CACHE)))
+        _AGENT_CACHE[key] = (now + AGENT_CACHE_TTL_SECONDS, result)
+        return result
     
-    def demo_image_analysis_agent(self):
+    def get_result_json(self, agent):
+        """Pre-serialized JSON bytes for an agent's result, e.g. for a FastAPI Response"""
+        return _RESULTS_JSON[agent]
+    
+    def _emit(self, out):
+        """Write a buffered block of lines to stdout in a single call"""
+        sys.stdout.write("\n".join(out))
+        sys.stdout.write("\n")
+    
+    async def demo_image_analysis_agent(self):
         """Demonstrate Image Analysis Agent with MONAI"""
-        self.print_section("Image Analysis Agent (MONAI-Powered)", "🧠")
-        
-        print("🔍 Analyzing chest X-ray for cardiac abnormalities...")
-        
-        # Simulated MONAI analysis results
-        image_analysis_results = {
-            "analysis_type": "Chest X-Ray Analysis",
-            "model_used": "MONAI DenseNet121",
-            "findings": {
-                "cardiomegaly": {
-                    "detected": True,
-                    "confidence": 0.87,
-                    "severity": "Moderate",
-                    "roi_coordinates": [(120, 150), (280, 320)]
-                },
-                "pulmonary_edema": {
-                    "detected": True,
-                    "confidence": 0.73,
-                    "severity": "Mild",
-                    "roi_coordinates": [(50, 80), (350, 280)]
-                },
-                "pleural_effusion": {
-                    "detected": False,
-                    "confidence": 0.23
-                }
-            },
-            "risk_assessment": {
-                "cardiac_risk": "HIGH",
-                "immediate_attention": True,
-                "follow_up_needed": "Echocardiogram within 24 hours"
-            },
-            "explainability": {
-                "attention_heatmap": "Generated visual heatmap highlighting cardiac silhouette",
-                "key_features": ["Enlarged cardiac shadow", "Vascular congestion patterns"],
-                "clinical_correlation": "Findings consistent with congestive heart failure"
-            }
-        }
+        out = []
+        self.print_section(out, "Image Analysis Agent (MONAI-Powered)", "🧠")
         
-        print(f"✅ Analysis Complete - Model: {image_analysis_results['model_used']}")
-        print(f"🎯 Key Findings:")
+        out.append("🔍 Analyzing chest X-ray for cardiac abnormalities...")
+        
+        image_analysis_results = await self._cached_result(
+            'imaging', lambda: asyncio.to_thread(_run_monai_analysis, self.demo_patient_data)
+        )
+        
+        out.append(f"✅ Analysis Complete - Model: {image_analysis_results['model_used']}")
+        out.append(f"🎯 Key Findings:")
         for finding, details in image_analysis_results['findings'].items():
             if details['detected']:
-                print(f"   • {finding.replace('_', ' ').title()}: {details['severity']} (Confidence: {details['confidence']:.1%})")
+                out.append(_FINDING_FMT.format_map({
+                    'name': _FINDING_NAME_CACHE[finding],
+                    'severity': details['severity'],
+                    'confidence': details['confidence']
+                }))
         
-        print(f"⚠️  Risk Assessment: {image_analysis_results['risk_assessment']['cardiac_risk']}")
-        print(f"📋 Recommendation: {image_analysis_results['risk_assessment']['follow_up_needed']}")
+        out.append(f"⚠️  Risk Assessment: {image_analysis_results['risk_assessment']['cardiac_risk']}")
+        out.append(f"📋 Recommendation: {image_analysis_results['risk_assessment']['follow_up_needed']}")
         
-        return image_analysis_results
+        return image_analysis_results, out
     
-    def demo_drug_interaction_agent(self):
+    async def demo_drug_interaction_agent(self):
         """Demonstrate Drug Interaction Agent"""
-        self.print_section("Drug Interaction & Safety Agent", "💊")
-        
-        print("🔍 Analyzing current medications for interactions...")
-        
-        # Simulated drug interaction analysis
-        drug_analysis_results = {
-            "medications_analyzed": len(self.demo_patient_data['current_medications']),
-            "interactions_found": {
-                "moderate_interactions": [
-                    {
-                        "drugs": ["Lisinopril", "Aspirin"],
-                        "interaction_type": "Moderate",
-                        "risk": "Increased risk of hyperkalemia",
-                        "recommendation": "Monitor potassium levels regularly",
-                        "severity_score": 6
-                    }
-                ],
-                "contraindications": [],
-                "warnings": [
-                    {
-                        "drug": "Metformin",
-                        "condition": "eGFR <60",
-                        "current_egfr": "75 mL/min/1.73m²",
-                        "status": "Safe - Monitor kidney function"
-                    }
-                ]
-            },
-            "dosage_optimization": {
-                "atorvastatin": {
-                    "current_dose": "40mg daily",
-                    "recommended_adjustment": "Consider increasing to 80mg given LDL >160",
-                    "monitoring": "Liver function tests in 6 weeks"
-                }
-            },
-            "adherence_score": 0.85,
-            "safety_score": "A-"
-        }
+        out = []
+        self.print_section(out, "Drug Interaction & Safety Agent", "💊")
+        
+        out.append("🔍 Analyzing current medications for interactions...")
         
-        print(f"✅ Analyzed {drug_analysis_results['medications_analyzed']} medications")
-        print(f"⚠️  Interactions Found:")
+        drug_analysis_results = await self._cached_result(
+            'drug_safety',
+            lambda: asyncio.to_thread(_check_drug_interactions, self.demo_patient_data['current_medications'])
+        )
+        
+        out.append(f"✅ Analyzed {drug_analysis_results['medications_analyzed']} medications")
+        out.append(f"⚠️  Interactions Found:")
         for interaction in drug_analysis_results['interactions_found']['moderate_interactions']:
-            print(f"   • {' + '.join(interaction['drugs'])}: {interaction['risk']}")
-            print(f"     💡 {interaction['recommendation']}")
+            out.append(f"   • {' + '.join(interaction['drugs'])}: {interaction['risk']}")
+            out.append(f"     💡 {interaction['recommendation']}")
         
-        print(f"📊 Safety Score: {drug_analysis_results['safety_score']}")
-        print(f"📈 Adherence Score: {drug_analysis_results['adherence_score']:.1%}")
+        out.append(f"📊 Safety Score: {drug_analysis_results['safety_score']}")
+        out.append(f"📈 Adherence Score: {drug_analysis_results['adherence_score']:.1%}")
         
-        return drug_analysis_results
+        return drug_analysis_results, out
     
-    def demo_clinical_decision_support_agent(self):
+    async def demo_clinical_decision_support_agent(self):
         """Demonstrate Clinical Decision Support Agent"""
-        self.print_section("Clinical Decision Support Agent", "🩺")
-        
-        print("🔍 Generating evidence-based clinical recommendations...")
-        
-        # Simulated clinical decision support
-        clinical_recommendations = {
-            "primary_diagnosis": {
-                "condition": "Acute Coronary Syndrome - NSTEMI",
-                "confidence": 0.78,
-                "evidence_level": "High",
-                "supporting_factors": [
-                    "Chest pain with cardiac risk factors",
-                    "Abnormal cardiac imaging",
-                    "History of previous MI"
-                ]
-            },
-            "risk_stratification": {
-                "grace_score": 142,
-                "risk_category": "High Risk",
-                "30_day_mortality_risk": "8.1%",
-                "recommendation": "Urgent cardiology consultation"
-            },
-            "treatment_recommendations": [
-                {
-                    "intervention": "Dual Antiplatelet Therapy",
-                    "evidence_grade": "Class I, Level A",
-                    "rationale": "Proven mortality benefit in NSTEMI",
-                    "duration": "12 months minimum"
-                },
-                {
-                    "intervention": "High-intensity Statin",
-                    "evidence_grade": "Class I, Level A", 
-                    "rationale": "LDL goal <70 mg/dL for secondary prevention",
-                    "adjustment": "Increase Atorvastatin to 80mg"
-                },
-                {
-                    "intervention": "ACE Inhibitor Optimization",
-                    "evidence_grade": "Class I, Level A",
-                    "rationale": "Proven benefit post-MI with diabetes",
-                    "adjustment": "Monitor kidney function closely"
-                }
-            ],
-            "monitoring_plan": {
-                "immediate": ["Cardiac enzymes q6h x3", "EKG monitoring", "Echocardiogram"],
-                "short_term": ["Stress test in 2-3 days", "Lipid panel in 6 weeks"],
-                "long_term": ["HbA1c q3months", "Annual coronary assessment"]
-            }
-        }
+        out = []
+        self.print_section(out, "Clinical Decision Support Agent", "🩺")
+        
+        out.append("🔍 Generating evidence-based clinical recommendations...")
         
-        print(f"🎯 Primary Diagnosis: {clinical_recommendations['primary_diagnosis']['condition']}")
-        print(f"   Confidence: {clinical_recommendations['primary_diagnosis']['confidence']:.1%}")
-        print(f"⚠️  Risk Category: {clinical_recommendations['risk_stratification']['risk_category']}")
-        print(f"   30-day Mortality Risk: {clinical_recommendations['risk_stratification']['30_day_mortality_risk']}")
+        clinical_recommendations = await self._cached_result('clinical_decision', lambda: _CLINICAL_RESULTS)
         
-        print("💡 Treatment Recommendations:")
+        out.append(f"🎯 Primary Diagnosis: {clinical_recommendations['primary_diagnosis']['condition']}")
+        out.append(f"   Confidence: {clinical_recommendations['primary_diagnosis']['confidence']:.1%}")
+        out.append(f"⚠️  Risk Category: {clinical_recommendations['risk_stratification']['risk_category']}")
+        out.append(f"   30-day Mortality Risk: {clinical_recommendations['risk_stratification']['30_day_mortality_risk']}")
+        
+        out.append("💡 Treatment Recommendations:")
         for rec in clinical_recommendations['treatment_recommendations']:
-            print(f"   • {rec['intervention']} ({rec['evidence_grade']})")
-            print(f"     {rec['rationale']}")
+            out.append(_TREATMENT_FMT.format_map(rec))
         
-        return clinical_recommendations
+        return clinical_recommendations, out
     
-    def demo_research_agent(self):
+    async def demo_research_agent(self):
         """Demonstrate Research & Clinical Trials Agent"""
-        self.print_section("Research & Clinical Trials Agent", "🔬")
-        
-        print("🔍 Searching for relevant clinical trials and latest research...")
-        
-        # Simulated research findings
-        research_results = {
-            "relevant_trials": [
-                {
-                    "trial_id": "NCT04567890", 
-                    "title": "PCSK9 Inhibitors in Post-MI Patients with Diabetes",
-                    "phase": "Phase III",
-                    "status": "Recruiting",
-                    "eligibility_match": 0.89,
-                    "location": "Multiple US Centers",
-                    "primary_endpoint": "Major adverse cardiovascular events at 2 years"
-                },
-                {
-                    "trial_id": "NCT04123456",
-                    "title": "AI-Guided Cardiac Rehabilitation in Elderly Diabetics", 
-                    "phase": "Phase II",
-                    "status": "Recruiting",
-                    "eligibility_match": 0.82,
-                    "location": "Mayo Clinic",
-                    "primary_endpoint": "Functional capacity improvement"
-                }
-            ],
-            "recent_research": [
-                {
-                    "title": "2024 Guidelines for Diabetes Management in CAD",
-                    "journal": "Journal of the American College of Cardiology",
-                    "impact_factor": 24.0,
-                    "relevance_score": 0.95,
-                    "key_finding": "Intensive glucose control reduces cardiac events by 18%"
-                },
-                {
-                    "title": "MONAI Deep Learning for Cardiac Risk Stratification",
-                    "journal": "Nature Medicine",
-                    "impact_factor": 87.2,
-                    "relevance_score": 0.88,
-                    "key_finding": "AI imaging analysis improves prognosis prediction by 23%"
-                }
-            ],
-            "evidence_synthesis": {
-                "recommendation_strength": "Strong",
-                "supporting_studies": 47,
-                "meta_analysis_result": "Consistent benefit across populations",
-                "clinical_applicability": "High - directly applicable to patient"
-            }
-        }
+        out = []
+        self.print_section(out, "Research & Clinical Trials Agent", "🔬")
+        
+        out.append("🔍 Searching for relevant clinical trials and latest research...")
         
-        print(f"🎯 Found {len(research_results['relevant_trials'])} matching clinical trials:")
+        research_results = await self._cached_result('research', lambda: _RESEARCH_RESULTS)
+        
+        out.append(f"🎯 Found {len(research_results['relevant_trials'])} matching clinical trials:")
         for trial in research_results['relevant_trials'][:2]:
-            print(f"   • {trial['title']} ({trial['phase']})")
-            print(f"     Match: {trial['eligibility_match']:.1%} | Status: {trial['status']}")
+            out.append(f"   • {trial['title']} ({trial['phase']})")
+            out.append(f"     Match: {trial['eligibility_match']:.1%} | Status: {trial['status']}")
         
-        print(f"📚 Recent Research Findings:")
+        out.append(f"📚 Recent Research Findings:")
         for research in research_results['recent_research'][:2]:
-            print(f"   • {research['title']}")
-            print(f"     {research['journal']} (IF: {research['impact_factor']})")
-            print(f"     💡 {research['key_finding']}")
+            out.append(f"   • {research['title']}")
+            out.append(f"     {research['journal']} (IF: {research['impact_factor']})")
+            out.append(f"     💡 {research['key_finding']}")
         
-        return research_results
+        return research_results, out
     
-    def demo_history_synthesis_agent(self):
+    async def demo_history_synthesis_agent(self):
         """Demonstrate History Synthesis Agent"""
-        self.print_section("Medical History Synthesis Agent", "📋")
-        
-        print("🔍 Synthesizing comprehensive medical timeline...")
-        
-        # Simulated history synthesis
-        history_synthesis = {
-            "timeline_analysis": {
-                "2019": "Myocardial infarction - Started secondary prevention",
-                "2020": "Diabetes diagnosis - Initiated metformin therapy", 
-                "2021": "Hypertension control achieved with Lisinopril",
-                "2022": "Statin therapy optimized for lipid goals",
-                "2023": "Stable course with medication adherence",
-                "2024": "Current presentation with recurrent symptoms"
-            },
-            "risk_factor_progression": {
-                "diabetes_control": {
-                    "trend": "Stable but suboptimal",
-                    "current_hba1c": "7.2%",
-                    "target": "<7.0%",
-                    "recommendation": "Consider intensification"
-                },
-                "lipid_management": {
-                    "trend": "Inadequate control",
-                    "current_ldl": "165 mg/dL",
-                    "target": "<70 mg/dL", 
-                    "recommendation": "Increase statin intensity"
-                },
-                "blood_pressure": {
-                    "trend": "Suboptimal control",
-                    "current_bp": "150/95",
-                    "target": "<130/80",
-                    "recommendation": "Consider combination therapy"
-                }
-            },
-            "medication_adherence_patterns": {
-                "overall_adherence": 0.85,
-                "high_adherence": ["Aspirin", "Metformin"],
-                "moderate_adherence": ["Lisinopril", "Atorvastatin"],
-                "barriers_identified": ["Cost concerns", "Side effect concerns"]
-            },
-            "care_gaps": [
-                "Annual diabetic eye exam overdue by 8 months",
-                "Influenza vaccination not documented", 
-                "Pneumococcal vaccine due",
-                "Colonoscopy screening overdue"
-            ]
-        }
+        out = []
+        self.print_section(out, "Medical History Synthesis Agent", "📋")
+        
+        out.append("🔍 Synthesizing comprehensive medical timeline...")
+        
+        history_synthesis = await self._cached_result('history', lambda: _HISTORY_RESULTS)
         
-        print("📊 Medical Timeline Summary:")
+        out.append("📊 Medical Timeline Summary:")
         for year, event in list(history_synthesis['timeline_analysis'].items())[-3:]:
-            print(f"   {year}: {event}")
+            out.append(f"   {year}: {event}")
         
-        print("⚠️  Risk Factor Control:")
+        out.append("⚠️  Risk Factor Control:")
         for factor, details in history_synthesis['risk_factor_progression'].items():
-            print(f"   • {factor.replace('_', ' ').title()}: {details['trend']}")
-            print(f"     Current: {details.get('current_hba1c', details.get('current_ldl', details.get('current_bp')))}")
+            out.append(_RISK_FACTOR_FMT.format_map({
+                'name': _FINDING_NAME_CACHE[factor],
+                'trend': details['trend'],
+                'current': details.get('current_hba1c', details.get('current_ldl', details.get('current_bp')))
+            }))
         
-        print(f"📈 Medication Adherence: {history_synthesis['medication_adherence_patterns']['overall_adherence']:.1%}")
-        print(f"⚠️  Care Gaps: {len(history_synthesis['care_gaps'])} identified")
+        out.append(f"📈 Medication Adherence: {history_synthesis['medication_adherence_patterns']['overall_adherence']:.1%}")
+        out.append(f"⚠️  Care Gaps: {len(history_synthesis['care_gaps'])} identified")
         
-        return history_synthesis
+        return history_synthesis, out
     
-    def demo_multi_agent_coordination(self):
+    async def demo_multi_agent_coordination(self, agent_results):
         """Demonstrate Multi-Agent Coordination and Report Generation"""
-        self.print_section("Multi-Agent Coordination & Final Report", "🤝")
-        
-        print("🔍 Coordinating all agents for comprehensive analysis...")
-        
-        # Simulated coordination results
-        coordination_results = {
-            "agent_consensus": {
-                "primary_concern": "Acute coronary syndrome with multiple comorbidities",
-                "urgency_level": "HIGH - Immediate intervention required",
-                "confidence_score": 0.84
-            },
-            "cross_agent_correlations": [
-                {
-                    "agents": ["Image Analysis", "Clinical Decision"],
-                    "finding": "Cardiomegaly on imaging correlates with heart failure risk",
-                    "clinical_impact": "Supports urgent echocardiogram"
-                },
-                {
-                    "agents": ["Drug Safety", "History Synthesis"],
-                    "finding": "Suboptimal adherence affecting risk factor control",
-                    "clinical_impact": "Suggests need for medication counseling"
-                },
-                {
-                    "agents": ["Research", "Clinical Decision"],
-                    "finding": "Patient eligible for clinical trial enrollment",
-                    "clinical_impact": "Access to cutting-edge therapies"
-                }
-            ],
-            "integrated_recommendations": [
-                "Immediate cardiology consultation with urgent echocardiogram",
-                "Optimize medical therapy per current guidelines",
-                "Enroll in cardiac rehabilitation program",
-                "Consider clinical trial participation",
-                "Implement comprehensive diabetes management",
-                "Address medication adherence barriers"
-            ],
-            "quality_metrics": {
-                "analysis_completeness": 0.94,
-                "evidence_strength": "High",
-                "recommendation_confidence": 0.87,
-                "patient_safety_score": "A+"
-            }
-        }
+        out = []
+        self.print_section(out, "Multi-Agent Coordination & Final Report", "🤝")
+        
+        out.append(f"🔍 Coordinating {len(agent_results)} agent reports for comprehensive analysis...")
+        
+        coordination_results = _COORDINATION_RESULTS
         
-        print(f"🎯 Agent Consensus: {coordination_results['agent_consensus']['primary_concern']}")
-        print(f"⚠️  Urgency: {coordination_results['agent_consensus']['urgency_level']}")
-        print(f"📊 Overall Confidence: {coordination_results['agent_consensus']['confidence_score']:.1%}")
+        out.append(f"🎯 Agent Consensus: {coordination_results['agent_consensus']['primary_concern']}")
+        out.append(f"⚠️  Urgency: {coordination_results['agent_consensus']['urgency_level']}")
+        out.append(f"📊 Overall Confidence: {coordination_results['agent_consensus']['confidence_score']:.1%}")
         
-        print("🔗 Cross-Agent Correlations:")
+        out.append("🔗 Cross-Agent Correlations:")
         for correlation in coordination_results['cross_agent_correlations']:
-            print(f"   • {' + '.join(correlation['agents'])}")
-            print(f"     Finding: {correlation['finding']}")
-            print(f"     Impact: {correlation['clinical_impact']}")
+            out.append(f"   • {' + '.join(correlation['agents'])}")
+            out.append(f"     Finding: {correlation['finding']}")
+            out.append(f"     Impact: {correlation['clinical_impact']}")
         
-        print("💡 Integrated Recommendations:")
+        out.append("💡 Integrated Recommendations:")
         for i, rec in enumerate(coordination_results['integrated_recommendations'], 1):
-            print(f"   {i}. {rec}")
+            out.append(_RECOMMENDATION_FMT.format_map({'index': i, 'text': rec}))
         
-        print(f"🏆 Quality Score: {coordination_results['quality_metrics']['patient_safety_score']}")
+        out.append(f"🏆 Quality Score: {coordination_results['quality_metrics']['patient_safety_score']}")
         
+        self._emit(out)
         return coordination_results
     
     async def run_complete_demo(self):
         """Run the complete multi-agent demo"""
-        self.print_header("🤖 MULTI-AGENT MEDICAL AI ANALYSIS DEMONSTRATION", "🏥")
+        out = []
+        self.print_header(out, "🤖 MULTI-AGENT MEDICAL AI ANALYSIS DEMONSTRATION", "🏥")
         
-        print(f"👤 Patient: {self.demo_patient_data['name']} (Age: {self.demo_patient_data['age']}, {self.demo_patient_data['gender']})")
-        print(f"📋 Chief Complaint: {', '.join(self.demo_patient_data['symptoms'])}")
-        print(f"🕐 Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        analysis_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        out.append(self._patient_line)
+        out.append(f"📋 Chief Complaint: {self._symptoms_joined}")
+        out.append(f"🕐 Analysis Time: {analysis_time}")
         
         # Run all agents
         results = {}
         
-        print("\n🚀 Initiating Multi-Agent Analysis...")
-        
-        # Agent 1: Image Analysis  
-        results['imaging'] = self.demo_image_analysis_agent()
-        
-        # Agent 2: Drug Interaction
-        results['drug_safety'] = self.demo_drug_interaction_agent()
-        
-        # Agent 3: Clinical Decision Support
-        results['clinical_decision'] = self.demo_clinical_decision_support_agent()
-        
-        # Agent 4: Research & Trials
-        results['research'] = self.demo_research_agent()
-        
-        # Agent 5: History Synthesis
-        results['history'] = self.demo_history_synthesis_agent()
-        
-        # Agent 6: Multi-Agent Coordination
-        results['coordination'] = self.demo_multi_agent_coordination()
+        out.append("\n🚀 Initiating Multi-Agent Analysis...")
+        self._emit(out)
+        
+        # Agents 1-5 are independent, so fan them out concurrently
+        agent_keys = ('imaging', 'drug_safety', 'clinical_decision', 'research', 'history')
+        gathered = await asyncio.gather(
+            self.demo_image_analysis_agent(),
+            self.demo_drug_interaction_agent(),
+            self.demo_clinical_decision_support_agent(),
+            self.demo_research_agent(),
+            self.demo_history_synthesis_agent(),
+            return_exceptions=True
+        )
+        # Agents return their buffered sections; emit them in a fixed order
+        # regardless of which finished first
+        out = []
+        failed_agents = []
+        for key, outcome in zip(agent_keys, gathered):
+            if isinstance(outcome, BaseException):
+                out.append(f"❌ Agent '{key}' failed: {outcome!r}")
+                failed_agents.append((key, outcome))
+                continue
+            results[key], agent_out = outcome
+            out.extend(agent_out)
+        self._emit(out)
+        
+        # Agent 6: Multi-Agent Coordination over the fan-in
+        results['coordination'] = await self.demo_multi_agent_coordination(results)
         
         # Final Summary
-        self.print_header("🎉 ANALYSIS COMPLETE - COMPREHENSIVE MEDICAL REPORT", "📊")
-        
-        print("✅ ALL AGENTS SUCCESSFULLY COMPLETED ANALYSIS")
-        print("🤖 6 Specialized AI Agents Collaborated")
-        print("📊 Comprehensive Multi-Modal Analysis Generated")
-        print("🎯 Evidence-Based Recommendations Provided")
-        print("⚡ Real-Time Coordination and Synthesis")
-        
-        print(f"\n📋 FINAL PATIENT REPORT SUMMARY:")
-        print(f"   🎯 Primary Diagnosis: Acute Coronary Syndrome - NSTEMI")
-        print(f"   ⚠️  Risk Level: HIGH - Immediate Intervention Required")
-        print(f"   💊 Drug Safety: A- (1 moderate interaction identified)")
-        print(f"   🧠 Imaging: Cardiomegaly + Pulmonary Edema detected")
-        print(f"   🔬 Research: 2 relevant clinical trials identified")
-        print(f"   📈 Quality Score: A+ (94% completeness)")
-        
-        print(f"\n🏥 NEXT STEPS:")
-        print(f"   1. ⚡ URGENT: Cardiology consultation within 2 hours")
-        print(f"   2. 📊 Echocardiogram within 24 hours")
-        print(f"   3. 💊 Optimize medical therapy per guidelines")
-        print(f"   4. 🔬 Consider clinical trial enrollment")
-        print(f"   5. 📋 Comprehensive medication review")
-        
+        out = []
+        self.print_header(out, "🎉 ANALYSIS COMPLETE - COMPREHENSIVE MEDICAL REPORT", "📊")
+        
+        if failed_agents:
+            out.append(f"⚠️  {len(failed_agents)} of {len(agent_keys)} agents failed: "
+                       f"{', '.join(key for key, _ in failed_agents)}")
+        else:
+            out.append("✅ ALL AGENTS SUCCESSFULLY COMPLETED ANALYSIS")
+        out.append("🤖 6 Specialized AI Agents Collaborated")
+        out.append("📊 Comprehensive Multi-Modal Analysis Generated")
+        out.append("🎯 Evidence-Based Recommendations Provided")
+        out.append("⚡ Real-Time Coordination and Synthesis")
+        
+        out.append(f"\n📋 FINAL PATIENT REPORT SUMMARY:")
+        out.append(f"   🎯 Primary Diagnosis: Acute Coronary Syndrome - NSTEMI")
+        out.append(f"   ⚠️  Risk Level: HIGH - Immediate Intervention Required")
+        out.append(f"   💊 Drug Safety: A- (1 moderate interaction identified)")
+        out.append(f"   🧠 Imaging: Cardiomegaly + Pulmonary Edema detected")
+        out.append(f"   🔬 Research: 2 relevant clinical trials identified")
+        out.append(f"   📈 Quality Score: A+ (94% completeness)")
+        
+        out.append(f"\n🏥 NEXT STEPS:")
+        out.append(f"   1. ⚡ URGENT: Cardiology consultation within 2 hours")
+        out.append(f"   2. 📊 Echocardiogram within 24 hours")
+        out.append(f"   3. 💊 Optimize medical therapy per guidelines")
+        out.append(f"   4. 🔬 Consider clinical trial enrollment")
+        out.append(f"   5. 📋 Comprehensive medication review")
+        
+        self._emit(out)
+        
+        # Surface agent failures to the caller once the report has been printed
+        if failed_agents:
+            raise RuntimeError(
+                f"{len(failed_agents)} agent(s) failed: {', '.join(key for key, _ in failed_agents)}"
+            ) from failed_agents[0][1]
         return results
 
+def run_async(coro):
+    """Run a coroutine on uvloop when available, else the default event loop"""
+    if UVLOOP_AVAILABLE:
+        if sys.version_info >= (3, 11):
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coro)
+        uvloop.install()
+    return asyncio.run(coro)
+
 def main():
     """Main demo function"""
     print("🚀 Starting Multi-Agent Medical AI Demo...")
@@ -481,7 +644,7 @@ def main():
     
     # Run the complete demo
     try:
-        results = asyncio.run(demo.run_complete_demo())
+        results = run_async(demo.run_complete_demo())
         
         print("\n" + "="*80)
         print("🎉 DEMO COMPLETE - MULTI-AGENT MEDICAL AI SYSTEM OPERATIONAL!")
@@ -4,9 +4,20 @@ Simple Multi-Agent System Test
 Test the multi-agent medical AI system without external dependencies
 """
 
+import importlib.util
 import sys
 import os
-sys.path.append('backend')
+# Put backend first so the agents package resolves on the first sys.path entry
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+# Agent modules probed for availability, with the class each one provides
+AGENT_MODULES = [
+    ('agents.image_analysis', 'ImageAnalysisAgent', 'Image Analysis Agent'),
+    ('agents.drug_interaction', 'DrugInteractionAgent', 'Drug Interaction Agent'),
+    ('agents.clinical_decision_support', 'ClinicalDecisionSupportAgent', 'Clinical Decision Support Agent'),
+    ('agents.research', 'ResearchAgent', 'Research Agent'),
+    ('agents.history_synthesis', 'HistorySynthesisAgent', 'History Synthesis Agent')
+]
 
 def test_multi_agent_system():
     """Test multi-agent system imports and basic functionality"""
@@ -27,40 +38,18 @@ def test_multi_agent_system():
         # Test 3: Test individual agents
         print("\n3. 🔍 Testing Individual Agents...")
         
-        # Test Image Analysis Agent
-        try:
-            from agents.image_analysis import MedicalImageAnalyzer
-            print("   ✅ Image Analysis Agent available")
-        except ImportError as e:
-            print(f"   ⚠️  Image Analysis Agent error: {e}")
-        
-        # Test Drug Interaction Agent  
-        try:
-            from agents.drug_interaction import DrugInteractionAgent
-            print("   ✅ Drug Interaction Agent available")
-        except ImportError as e:
-            print(f"   ⚠️  Drug Interaction Agent error: {e}")
-            
-        # Test Clinical Decision Support
-        try:
-            from agents.clinical_decision_support import ClinicalDecisionAgent
-            print("   ✅ Clinical Decision Support Agent available")
-        except ImportError as e:
-            print(f"   ⚠️  Clinical Decision Support Agent error: {e}")
-            
-        # Test Research Agent
-        try:
-            from agents.research import ResearchAgent
-            print("   ✅ Research Agent available")
-        except ImportError as e:
-            print(f"   ⚠️  Research Agent error: {e}")
-            
-        # Test History Synthesis Agent
-        try:
-            from agents.history_synthesis import HistorySynthesisAgent
-            print("   ✅ History Synthesis Agent available")
-        except ImportError as e:
-            print(f"   ⚠️  History Synthesis Agent error: {e}")
+        for module_name, class_name, label in AGENT_MODULES:
+            # find_spec locates the module without executing its top-level imports
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except ImportError as e:
+                print(f"   ⚠️  {label} error: {e}")
+                continue
+            if spec is not None:
+                # Only the module is located here; class_name is not checked until imported
+                print(f"   ✅ {label} module found")
+            else:
+                print(f"   ⚠️  {label} error: No module named '{module_name}'")
         
         # Test 4: Test Demo Data Generator
         print("\n4. 📊 Testing Demo Data Generator...")
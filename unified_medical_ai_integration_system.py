@@ -6,15 +6,132 @@ Complete integration of all notebooks, agents, and visualizations with comprehen
 
 import sys
 import os
-import asyncio
-import json
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from pathlib import Path
 
-# Add all system paths
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend', 'agents'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend', 'utils'))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Add all system paths, skipping any already present so re-imports do not grow sys.path
+_BACKEND_DIR = os.path.join(os.path.dirname(__file__), 'backend')
+_existing_paths = set(sys.path)
+for _path in (_BACKEND_DIR, os.path.join(_BACKEND_DIR, 'agents'), os.path.join(_BACKEND_DIR, 'utils')):
+    if _path not in _existing_paths:
+        sys.path.append(_path)
+
+# (display name, status key, file, features) for each notebook checked by test_notebook_integration
+_NOTEBOOK_TESTS = (
+    ("Medical Image Analysis", "image_analysis", "notebooks/Comprehensive_Medical_Image_Analysis.ipynb",
+     ("MONAI integration", "Interactive heatmaps", "ROI detection", "Confidence charts")),
+    ("Clinical Decision Support", "clinical_decision", "notebooks/Ultra_Advanced_Clinical_Decision_Support.ipynb",
+     ("Risk radar charts", "Decision trees", "Treatment timelines", "Guideline compliance")),
+    ("Drug Safety Analysis", "drug_safety", "notebooks/Ultra_Advanced_Drug_Safety_Analysis.ipynb",
+     ("Interaction matrix", "Safety heatmaps", "Network graphs", "Dosage curves")),
+    ("Precision Medicine", "precision_medicine", "notebooks/Ultra_Advanced_Precision_Medicine.ipynb",
+     ("Genomic plots", "Biomarker trends", "Treatment response", "Risk stratification")),
+    ("Research Integration", "research", "notebooks/Ultra_Advanced_Research.ipynb",
+     ("Trial matching", "Evidence network", "Publication trends", "Impact analysis")),
+)
+
+# (display name, status key, file, features) for each agent module checked by test_agent_integration
+_AGENT_TESTS = (
+    ("Multi-Agent Controller", "multi_agent_system", "backend/agents/multi_agent_system.py",
+     ("Agent coordination", "Performance dashboard", "Network graph", "Timeline viz")),
+    ("Image Analysis Agent", "image_analysis", "backend/agents/image_analysis.py",
+     ("MONAI processing", "Heatmap generation", "ROI detection", "Pathology classification")),
+    ("Drug Interaction Agent", "drug_interaction", "backend/agents/drug_interaction.py",
+     ("Interaction detection", "Safety scoring", "Recommendation engine", "Alert system")),
+    ("Clinical Decision Agent", "clinical_decision", "backend/agents/clinical_decision_support.py",
+     ("Evidence synthesis", "Risk assessment", "Guideline compliance", "Treatment recommendations")),
+    ("Research Agent", "research", "backend/agents/research.py",
+     ("Trial matching", "Evidence retrieval", "Literature synthesis", "Impact analysis")),
+    ("History Synthesis Agent", "history_synthesis", "backend/agents/history_synthesis.py",
+     ("Timeline creation", "Pattern recognition", "Risk factor analysis", "Trend identification")),
+)
+
+# (module, label) for each plotting library checked by test_visualization_engine
+_VISUALIZATION_LIBS = (
+    ("matplotlib", "Matplotlib"),
+    ("seaborn", "Seaborn"),
+    ("plotly", "Plotly"),
+    ("networkx", "NetworkX")
+)
+
+# Engine module checked by test_visualization_engine
+VISUALIZATION_ENGINE_FILE = "backend/utils/medical_visualization_engine.py"
+
+# Where run_comprehensive_test writes the detailed JSON report
+REPORT_FILE = "unified_integration_report.json"
+
+def _encode_report(summary):
+    """Serialize the integration summary to indented UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(summary, indent=2, ensure_ascii=False, default=asdict).encode("utf-8")
+
+def _write_report(summary):
+    """Encode the integration summary and write it to REPORT_FILE"""
+    with open(REPORT_FILE, "wb") as f:
+        f.write(_encode_report(summary))
+
+# Single background writer so the report is saved while results are printed
+_REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+
+# Static capability lists shared by every summary; callers must not mutate them
+_STATIC_CAPABILITIES = {
+    "notebook_features": (
+        "Interactive medical image analysis with MONAI",
+        "Clinical decision support with evidence-based recommendations",
+        "Comprehensive drug safety analysis with interaction networks",
+        "Precision medicine with genomic and biomarker integration",
+        "Research synthesis with clinical trial matching"
+    ),
+    "agent_features": (
+        "Multi-agent coordination with real-time performance monitoring",
+        "AI-powered image analysis with visual heatmaps",
+        "Real-time drug interaction detection and safety scoring",
+        "Evidence-based clinical decision support",
+        "Automated research synthesis and trial matching",
+        "Patient history integration with timeline visualization"
+    ),
+    "visualization_features": (
+        "Interactive plotly dashboards for real-time analysis",
+        "Medical heatmaps with matplotlib for pathology detection",
+        "Network graphs for drug interactions and system architecture",
+        "Radar charts for risk factor analysis",
+        "Timeline visualizations for patient history and treatment plans",
+        "Performance dashboards for multi-agent system monitoring"
+    )
+}
+
+# Achievements listed in every summary and echoed by run_comprehensive_test
+_INTEGRATION_ACHIEVEMENTS = (
+    "✅ All 5 Jupyter notebooks enhanced with advanced visualizations",
+    "✅ All 6 multi-agent files integrated with real-time chart generation",
+    "✅ Unified visualization engine connecting all system components",
+    "✅ Comprehensive demo system with interactive medical analysis",
+    "✅ Real-time performance monitoring and system network visualization",
+    "✅ Cross-component data flow with shared graphing infrastructure"
+)
+
+@dataclass(slots=True)
+class ComponentStatus:
+    """Load state of one notebook or agent"""
+    loaded: bool = False
+    visualizations: tuple = ()
+
+def _module_importable(module_path):
+    """Check that a module can be located without executing it"""
+    try:
+        return importlib.util.find_spec(module_path) is not None
+    except ImportError:
+        return False
 
 class UnifiedMedicalAISystem:
     """
@@ -22,211 +139,152 @@ class UnifiedMedicalAISystem:
     """
     
     def __init__(self):
+        self.notebooks = {key: ComponentStatus() for _, key, _, _ in _NOTEBOOK_TESTS}
+        self.agents = {key: ComponentStatus() for _, key, _, _ in _AGENT_TESTS}
         self.system_status = {
-            "notebooks": {
-                "image_analysis": {"loaded": False, "visualizations": []},
-                "clinical_decision": {"loaded": False, "visualizations": []},
-                "drug_safety": {"loaded": False, "visualizations": []},
-                "precision_medicine": {"loaded": False, "visualizations": []},
-                "research": {"loaded": False, "visualizations": []}
-            },
-            "agents": {
-                "multi_agent_system": {"loaded": False, "visualizations": []},
-                "image_analysis": {"loaded": False, "visualizations": []},
-                "drug_interaction": {"loaded": False, "visualizations": []},
-                "clinical_decision": {"loaded": False, "visualizations": []},
-                "research": {"loaded": False, "visualizations": []},
-                "history_synthesis": {"loaded": False, "visualizations": []}
-            },
-            "visualization_engine": {"loaded": False, "features": []},
-            "integration_tests": {"passed": 0, "failed": 0, "total": 0}
+            "notebooks": self.notebooks,
+            "agents": self.agents,
+            "visualization_engine": {"loaded": False, "features": []}
         }
+        # Integration test tallies as [passed, failed, total]
+        self._counts = [0, 0, 0]
+        self._dir_cache = {}
         
+    def _snapshot_dir(self, directory):
+        """List the regular files in a directory once and cache the names"""
+        if directory not in self._dir_cache:
+            try:
+                with os.scandir(directory) as entries:
+                    self._dir_cache[directory] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                # A missing or unreadable directory means none of its files are present
+                self._dir_cache[directory] = set()
+        return self._dir_cache[directory]
+    
+    def _file_present(self, path):
+        """Check a file against its directory snapshot, listing the directory on first use"""
+        directory, name = os.path.split(path)
+        return name in self._snapshot_dir(directory or ".")
+    
+    @staticmethod
+    def _write_lines(lines):
+        """Write a block of output lines to stdout in a single call"""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     def test_notebook_integration(self):
         """Test notebook integration and visualization capabilities"""
-        print("📔 Testing Notebook Integration...")
+        lines = ["📔 Testing Notebook Integration..."]
+        passed = 0
         
-        notebook_tests = [
-            {
-                "name": "Medical Image Analysis",
-                "file": "notebooks/Comprehensive_Medical_Image_Analysis.ipynb",
-                "expected_features": ["MONAI integration", "Interactive heatmaps", "ROI detection", "Confidence charts"]
-            },
-            {
-                "name": "Clinical Decision Support", 
-                "file": "notebooks/Ultra_Advanced_Clinical_Decision_Support.ipynb",
-                "expected_features": ["Risk radar charts", "Decision trees", "Treatment timelines", "Guideline compliance"]
-            },
-            {
-                "name": "Drug Safety Analysis",
-                "file": "notebooks/Ultra_Advanced_Drug_Safety_Analysis.ipynb", 
-                "expected_features": ["Interaction matrix", "Safety heatmaps", "Network graphs", "Dosage curves"]
-            },
-            {
-                "name": "Precision Medicine",
-                "file": "notebooks/Ultra_Advanced_Precision_Medicine.ipynb",
-                "expected_features": ["Genomic plots", "Biomarker trends", "Treatment response", "Risk stratification"]
-            },
-            {
-                "name": "Research Integration",
-                "file": "notebooks/Ultra_Advanced_Research.ipynb",
-                "expected_features": ["Trial matching", "Evidence network", "Publication trends", "Impact analysis"]
-            }
-        ]
+        for name, key, path, features in _NOTEBOOK_TESTS:
+            # Check if notebook file exists
+            if self._file_present(path):
+                lines.append(f"   ✅ {name}: File found")
+                status = self.notebooks[key]
+                status.loaded = True
+                status.visualizations = features
+                passed += 1
+            else:
+                lines.append(f"   ❌ {name}: File not found")
         
-        for test in notebook_tests:
-            try:
-                # Check if notebook file exists
-                notebook_path = Path(test["file"])
-                if notebook_path.exists():
-                    print(f"   ✅ {test['name']}: File found")
-                    self.system_status["notebooks"][test["name"].lower().replace(" ", "_")]["loaded"] = True
-                    self.system_status["notebooks"][test["name"].lower().replace(" ", "_")]["visualizations"] = test["expected_features"]
-                    self.system_status["integration_tests"]["passed"] += 1
-                else:
-                    print(f"   ❌ {test['name']}: File not found")
-                    self.system_status["integration_tests"]["failed"] += 1
-                    
-                self.system_status["integration_tests"]["total"] += 1
-                    
-            except Exception as e:
-                print(f"   ❌ {test['name']}: Error - {e}")
-                self.system_status["integration_tests"]["failed"] += 1
-                self.system_status["integration_tests"]["total"] += 1
+        self._write_lines(lines)
+        total = len(_NOTEBOOK_TESTS)
+        return passed, total - passed, total
     
     def test_agent_integration(self):
         """Test multi-agent system integration"""
-        print("🤖 Testing Multi-Agent System Integration...")
+        lines = ["🤖 Testing Multi-Agent System Integration..."]
+        passed = 0
         
-        agent_tests = [
-            {
-                "name": "Multi-Agent Controller",
-                "file": "backend/agents/multi_agent_system.py",
-                "expected_features": ["Agent coordination", "Performance dashboard", "Network graph", "Timeline viz"]
-            },
-            {
-                "name": "Image Analysis Agent",
-                "file": "backend/agents/image_analysis.py", 
-                "expected_features": ["MONAI processing", "Heatmap generation", "ROI detection", "Pathology classification"]
-            },
-            {
-                "name": "Drug Interaction Agent",
-                "file": "backend/agents/drug_interaction.py",
-                "expected_features": ["Interaction detection", "Safety scoring", "Recommendation engine", "Alert system"]
-            },
-            {
-                "name": "Clinical Decision Agent",
-                "file": "backend/agents/clinical_decision_support.py",
-                "expected_features": ["Evidence synthesis", "Risk assessment", "Guideline compliance", "Treatment recommendations"]
-            },
-            {
-                "name": "Research Agent", 
-                "file": "backend/agents/research.py",
-                "expected_features": ["Trial matching", "Evidence retrieval", "Literature synthesis", "Impact analysis"]
-            },
-            {
-                "name": "History Synthesis Agent",
-                "file": "backend/agents/history_synthesis.py",
-                "expected_features": ["Timeline creation", "Pattern recognition", "Risk factor analysis", "Trend identification"]
-            }
-        ]
+        for name, key, path, features in _AGENT_TESTS:
+            if not self._file_present(path):
+                lines.append(f"   ❌ {name}: Agent file not found")
+                continue
+            
+            # Locate the module without importing the agent and its heavy dependencies
+            module_path = "agents." + os.path.splitext(os.path.basename(path))[0]
+            if _module_importable(module_path):
+                lines.append(f"   ✅ {name}: Agent file found")
+                status = self.agents[key]
+                status.loaded = True
+                status.visualizations = features
+                passed += 1
+            else:
+                lines.append(f"   ❌ {name}: Agent module not importable")
         
-        for test in agent_tests:
-            try:
-                agent_path = Path(test["file"])
-                if agent_path.exists():
-                    print(f"   ✅ {test['name']}: Agent file found")
-                    
-                    # Try to import and check for visualization methods
-                    agent_key = test["name"].lower().replace(" ", "_").replace("_agent", "")
-                    self.system_status["agents"][agent_key]["loaded"] = True
-                    self.system_status["agents"][agent_key]["visualizations"] = test["expected_features"]
-                    self.system_status["integration_tests"]["passed"] += 1
-                else:
-                    print(f"   ❌ {test['name']}: Agent file not found")
-                    self.system_status["integration_tests"]["failed"] += 1
-                    
-                self.system_status["integration_tests"]["total"] += 1
-                    
-            except Exception as e:
-                print(f"   ❌ {test['name']}: Error - {e}")
-                self.system_status["integration_tests"]["failed"] += 1
-                self.system_status["integration_tests"]["total"] += 1
+        self._write_lines(lines)
+        total = len(_AGENT_TESTS)
+        return passed, total - passed, total
     
     def test_visualization_engine(self):
         """Test visualization engine capabilities"""
-        print("🎨 Testing Visualization Engine...")
+        lines = ["🎨 Testing Visualization Engine..."]
         
-        try:
-            # Test matplotlib
-            import matplotlib.pyplot as plt
-            print("   ✅ Matplotlib: Available")
-            
-            # Test seaborn
-            import seaborn as sns
-            print("   ✅ Seaborn: Available")
-            
-            # Test plotly
-            import plotly.graph_objects as go
-            print("   ✅ Plotly: Available")
-            
-            # Test networkx
-            import networkx as nx
-            print("   ✅ NetworkX: Available")
-            
-            # Test visualization engine
-            viz_engine_path = Path("backend/utils/medical_visualization_engine.py")
-            if viz_engine_path.exists():
-                print("   ✅ Medical Visualization Engine: Available")
-                self.system_status["visualization_engine"]["loaded"] = True
-                self.system_status["visualization_engine"]["features"] = [
-                    "Agent performance dashboard", "Medical network graphs", 
-                    "Real-time analysis charts", "Medical heatmaps", "Patient timelines"
-                ]
-                self.system_status["integration_tests"]["passed"] += 4
-            else:
-                print("   ❌ Medical Visualization Engine: Not found")
-                self.system_status["integration_tests"]["failed"] += 1
-            
-            self.system_status["integration_tests"]["total"] += 4
-            
-        except ImportError as e:
-            print(f"   ❌ Visualization Library Missing: {e}")
-            self.system_status["integration_tests"]["failed"] += 1
-            self.system_status["integration_tests"]["total"] += 1
+        # find_spec locates each library without executing its import
+        for module_name, label in _VISUALIZATION_LIBS:
+            if importlib.util.find_spec(module_name) is None:
+                lines.append(f"   ❌ Visualization Library Missing: {module_name}")
+                self._write_lines(lines)
+                return 0, 1, 1
+            lines.append(f"   ✅ {label}: Available")
+        
+        # Test visualization engine
+        if self._file_present(VISUALIZATION_ENGINE_FILE):
+            lines.append("   ✅ Medical Visualization Engine: Available")
+            self.system_status["visualization_engine"]["loaded"] = True
+            self.system_status["visualization_engine"]["features"] = [
+                "Agent performance dashboard", "Medical network graphs", 
+                "Real-time analysis charts", "Medical heatmaps", "Patient timelines"
+            ]
+            self._write_lines(lines)
+            return 4, 0, 4
+        
+        lines.append("   ❌ Medical Visualization Engine: Not found")
+        self._write_lines(lines)
+        return 0, 1, 4
     
     def test_demo_execution(self):
         """Test demo execution capabilities"""
-        print("🚀 Testing Demo Execution...")
+        lines = ["🚀 Testing Demo Execution..."]
+        passed = failed = 0
         
-        try:
-            # Test multi-agent demo
-            demo_file = Path("multi_agent_complete_demo.py")
-            if demo_file.exists():
-                print("   ✅ Multi-Agent Demo: Available")
-                self.system_status["integration_tests"]["passed"] += 1
-            else:
-                print("   ❌ Multi-Agent Demo: Not found")
-                self.system_status["integration_tests"]["failed"] += 1
-            
-            # Test visualization demo
-            viz_demo_file = Path("multi_agent_visualization_demo.py")
-            if viz_demo_file.exists():
-                print("   ✅ Visualization Demo: Available")
-                self.system_status["integration_tests"]["passed"] += 1
-            else:
-                print("   ❌ Visualization Demo: Not found")
-                self.system_status["integration_tests"]["failed"] += 1
-            
-            self.system_status["integration_tests"]["total"] += 2
-            
-        except Exception as e:
-            print(f"   ❌ Demo Execution Error: {e}")
-            self.system_status["integration_tests"]["failed"] += 2
-            self.system_status["integration_tests"]["total"] += 2
+        # Test multi-agent demo
+        if self._file_present("multi_agent_complete_demo.py"):
+            lines.append("   ✅ Multi-Agent Demo: Available")
+            passed += 1
+        else:
+            lines.append("   ❌ Multi-Agent Demo: Not found")
+            failed += 1
+        
+        # Test visualization demo
+        if self._file_present("multi_agent_visualization_demo.py"):
+            lines.append("   ✅ Visualization Demo: Available")
+            passed += 1
+        else:
+            lines.append("   ❌ Visualization Demo: Not found")
+            failed += 1
+        
+        self._write_lines(lines)
+        return passed, failed, 2
+    
+    def _run_all(self):
+        """Run the test phases and tally their counts"""
+        phase_counts = (
+            self.test_notebook_integration(),
+            self.test_agent_integration(),
+            self.test_visualization_engine(),
+            self.test_demo_execution()
+        )
+        
+        counts = self._counts
+        for passed, failed, total in phase_counts:
+            counts[0] += passed
+            counts[1] += failed
+            counts[2] += total
     
     def create_integration_summary(self):
         """Create comprehensive integration summary"""
+        passed, failed, total = self._counts
         summary = {
             "system_overview": {
                 "total_notebooks": 5,
@@ -235,47 +293,18 @@ class UnifiedMedicalAISystem:
                 "integration_date": datetime.now().isoformat(),
                 "system_status": "Fully Integrated"
             },
-            "component_status": self.system_status,
-            "test_results": {
-                "total_tests": self.system_status["integration_tests"]["total"],
-                "tests_passed": self.system_status["integration_tests"]["passed"],
-                "tests_failed": self.system_status["integration_tests"]["failed"],
-                "success_rate": (self.system_status["integration_tests"]["passed"] / 
-                               max(self.system_status["integration_tests"]["total"], 1)) * 100
+            "component_status": {
+                **self.system_status,
+                "integration_tests": {"passed": passed, "failed": failed, "total": total}
             },
-            "capabilities": {
-                "notebook_features": [
-                    "Interactive medical image analysis with MONAI",
-                    "Clinical decision support with evidence-based recommendations", 
-                    "Comprehensive drug safety analysis with interaction networks",
-                    "Precision medicine with genomic and biomarker integration",
-                    "Research synthesis with clinical trial matching"
-                ],
-                "agent_features": [
-                    "Multi-agent coordination with real-time performance monitoring",
-                    "AI-powered image analysis with visual heatmaps",
-                    "Real-time drug interaction detection and safety scoring",
-                    "Evidence-based clinical decision support",
-                    "Automated research synthesis and trial matching",
-                    "Patient history integration with timeline visualization"
-                ],
-                "visualization_features": [
-                    "Interactive plotly dashboards for real-time analysis",
-                    "Medical heatmaps with matplotlib for pathology detection",
-                    "Network graphs for drug interactions and system architecture",
-                    "Radar charts for risk factor analysis",
-                    "Timeline visualizations for patient history and treatment plans",
-                    "Performance dashboards for multi-agent system monitoring"
-                ]
+            "test_results": {
+                "total_tests": total,
+                "tests_passed": passed,
+                "tests_failed": failed,
+                "success_rate": passed / total * 100 if total else 0.0
             },
-            "integration_achievements": [
-                "✅ All 5 Jupyter notebooks enhanced with advanced visualizations",
-                "✅ All 6 multi-agent files integrated with real-time chart generation", 
-                "✅ Unified visualization engine connecting all system components",
-                "✅ Comprehensive demo system with interactive medical analysis",
-                "✅ Real-time performance monitoring and system network visualization",
-                "✅ Cross-component data flow with shared graphing infrastructure"
-            ]
+            "capabilities": _STATIC_CAPABILITIES,
+            "integration_achievements": _INTEGRATION_ACHIEVEMENTS
         }
         
         return summary
@@ -286,37 +315,34 @@ class UnifiedMedicalAISystem:
         print("=" * 70)
         
         # Run all tests
-        self.test_notebook_integration()
-        self.test_agent_integration()
-        self.test_visualization_engine()
-        self.test_demo_execution()
+        self._run_all()
         
-        # Generate summary
+        # Generate summary and start saving the detailed report in the background
         summary = self.create_integration_summary()
+        report_future = _REPORT_EXECUTOR.submit(_write_report, summary)
         
         # Print results
-        print("\n" + "=" * 70)
-        print("📊 INTEGRATION TEST RESULTS")
-        print("=" * 70)
-        
-        print(f"✅ Tests Passed: {summary['test_results']['tests_passed']}")
-        print(f"❌ Tests Failed: {summary['test_results']['tests_failed']}")  
-        print(f"📈 Success Rate: {summary['test_results']['success_rate']:.1f}%")
-        
-        print(f"\n🔗 SYSTEM INTEGRATION STATUS")
-        print(f"📔 Notebooks: {len([n for n in self.system_status['notebooks'].values() if n['loaded']])}/5 loaded")
-        print(f"🤖 Agents: {len([a for a in self.system_status['agents'].values() if a['loaded']])}/6 loaded") 
-        print(f"🎨 Visualization Engine: {'✅' if self.system_status['visualization_engine']['loaded'] else '❌'}")
-        
-        print(f"\n🎯 INTEGRATION ACHIEVEMENTS:")
-        for achievement in summary['integration_achievements']:
-            print(f"   {achievement}")
+        results = summary['test_results']
+        lines = [
+            "\n" + "=" * 70,
+            "📊 INTEGRATION TEST RESULTS",
+            "=" * 70,
+            f"✅ Tests Passed: {results['tests_passed']}",
+            f"❌ Tests Failed: {results['tests_failed']}",
+            f"📈 Success Rate: {results['success_rate']:.1f}%",
+            f"\n🔗 SYSTEM INTEGRATION STATUS",
+            f"📔 Notebooks: {sum(n.loaded for n in self.notebooks.values())}/5 loaded",
+            f"🤖 Agents: {sum(a.loaded for a in self.agents.values())}/6 loaded",
+            f"🎨 Visualization Engine: {'✅' if self.system_status['visualization_engine']['loaded'] else '❌'}",
+            f"\n🎯 INTEGRATION ACHIEVEMENTS:"
+        ]
+        lines += [f"   {achievement}" for achievement in summary['integration_achievements']]
+        self._write_lines(lines)
         
-        # Save detailed report
-        with open("unified_integration_report.json", "w") as f:
-            json.dump(summary, f, indent=2)
+        # Wait for the detailed report to finish saving
+        report_future.result()
         
-        print(f"\n📁 Detailed report saved: unified_integration_report.json")
+        print(f"\n📁 Detailed report saved: {REPORT_FILE}")
         
         if summary['test_results']['success_rate'] >= 80:
             print("\n🏆 INTEGRATION SUCCESSFUL - SYSTEM READY FOR PRODUCTION!")